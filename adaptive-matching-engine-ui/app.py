@@ -6,12 +6,14 @@ Real-time visualization of Adaptive vs NSE Traditional Matching Engine
 import streamlit as st
 import sys
 import os
-import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-import json
+import orjson
 from datetime import datetime
 
 # Add parent directory to path to import matching engine
@@ -22,10 +24,12 @@ sys.path.insert(
     ),
 )
 
-from src.core.matching_engine import AdaptiveMatchingEngine, BaseMatchingEngine
-from src.core.nse_matching_engine import NSEMatchingEngine
 from src.data.order_generator import OrderGenerator
-from src.core.order_types import OrderSide
+from benchmark_workers import (
+    ENGINE_KINDS,
+    LATENCY_BUCKET_LABELS,
+    benchmark_engine,
+)
 
 # Page configuration
 st.set_page_config(
@@ -73,129 +77,70 @@ if "live_data" not in st.session_state:
     st.session_state.live_data = {"base": [], "nse": [], "adaptive": []}
 
 
-def run_benchmark(order_count, volatility, adaptive_config=None):
-    """Run performance benchmark comparing all three engines"""
-    if adaptive_config is None:
-        adaptive_config = {}  # Use defaults
-
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-
-    generator = OrderGenerator(price_range=(18000.0, 19000.0))
-    orders = generator.generate_orders(order_count, volatility=volatility)
-
-    results = {}
+@st.cache_data(max_entries=8, show_spinner=False)
+def generate_benchmark_batch(order_count, volatility, seed=0):
+    """Generate (and memoize) a reproducible order stream as numpy columns"""
+    generator = OrderGenerator(price_range=(18000.0, 19000.0), seed=seed)
+    return generator.generate_orders_soa(order_count, volatility=volatility)
 
-    # Test Base Engine
-    status_text.text("Testing Base Engine...")
-    progress_bar.progress(0.1)
-    base_engine = BaseMatchingEngine()
 
-    start = time.perf_counter()
-    trades_base = 0
-    latencies_base = []
-
-    for order in orders:
-        order_start = time.perf_counter()
-        trades = base_engine.process_order(order)
-        latencies_base.append((time.perf_counter() - order_start) * 1000)
-        trades_base += len(trades)
-
-    time_base = time.perf_counter() - start
-
-    results["base"] = {
-        "name": "Base Engine (Simple Price-Time)",
-        "time": time_base,
-        "throughput": order_count / time_base,
-        "avg_latency": sum(latencies_base) / len(latencies_base),
-        "trades": trades_base,
-        "latencies": latencies_base,
-    }
-    progress_bar.progress(0.4)
-
-    # Test NSE Engine
-    status_text.text("Testing NSE Traditional Engine...")
-    nse_engine = NSEMatchingEngine(symbol="NIFTY")
-    nse_engine.set_reference_price(18500.0)
-
-    orders_nse = generator.generate_orders(order_count, volatility=volatility)
-
-    start = time.perf_counter()
-    trades_nse = 0
-    latencies_nse = []
-
-    for order in orders_nse:
-        order_start = time.perf_counter()
-        trades = nse_engine.process_order(order)
-        latencies_nse.append((time.perf_counter() - order_start) * 1000)
-        trades_nse += len(trades)
-
-    time_nse = time.perf_counter() - start
-    nse_stats = nse_engine.get_statistics()
-
-    results["nse"] = {
-        "name": "NSE Traditional Engine",
-        "time": time_nse,
-        "throughput": order_count / time_nse,
-        "avg_latency": sum(latencies_nse) / len(latencies_nse),
-        "trades": trades_nse,
-        "latencies": latencies_nse,
-        "circuit_breakers": nse_stats["circuit_breaker_hits"],
-    }
-    progress_bar.progress(0.7)
-
-    # Test Adaptive Engine
-    status_text.text("Testing Adaptive Engine...")
-    adaptive_engine = AdaptiveMatchingEngine(config=adaptive_config)
-
-    orders_adaptive = generator.generate_orders(order_count, volatility=volatility)
-
-    start = time.perf_counter()
-    trades_adaptive = 0
-    latencies_adaptive = []
-
-    for order in orders_adaptive:
-        order_start = time.perf_counter()
-        trades = adaptive_engine.process_order(order)
-        latencies_adaptive.append((time.perf_counter() - order_start) * 1000)
-        trades_adaptive += len(trades)
-
-    time_adaptive = time.perf_counter() - start
-
-    results["adaptive"] = {
-        "name": "Adaptive Engine",
-        "time": time_adaptive,
-        "throughput": order_count / time_adaptive,
-        "avg_latency": sum(latencies_adaptive) / len(latencies_adaptive),
-        "trades": trades_adaptive,
-        "latencies": latencies_adaptive,
-        "regime_changes": adaptive_engine.regime_change_count,
-        "final_regime": adaptive_engine.current_regime.value,
-        "regime_stats": adaptive_engine.get_regime_statistics(),
-        "config": adaptive_engine.get_config(),
-    }
+def run_benchmark(order_count, volatility, adaptive_config=None, seed=0):
+    """
+    Run performance benchmark comparing all three engines.
 
-    progress_bar.progress(1.0)
-    status_text.text("Benchmark Complete!")
-    time.sleep(0.5)
-    progress_bar.empty()
-    status_text.empty()
+    Pure computation (no widgets), so it is safe to call from cached_benchmark;
+    the caller draws the progress UI.
+    """
+    if adaptive_config is None:
+        adaptive_config = {}  # Use defaults
 
-    return results
+    # The order stream is generated once as contiguous arrays; each worker
+    # builds its own Order objects from the same columns
+    batch = generate_benchmark_batch(order_count, volatility, seed)
+
+    # The three engine runs are independent, so run them on separate cores
+    with ProcessPoolExecutor(max_workers=len(ENGINE_KINDS)) as executor:
+        futures = {
+            kind: executor.submit(benchmark_engine, kind, batch, adaptive_config)
+            for kind in ENGINE_KINDS
+        }
+        # Keep a stable engine order for the charts and the export
+        return {kind: future.result() for kind, future in futures.items()}
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def cached_benchmark(order_count, volatility, adaptive_config_items, seed=0):
+    """Memoized run_benchmark keyed by a hashable view of the adaptive config"""
+    return run_benchmark(order_count, volatility, dict(adaptive_config_items), seed)
+
+
+def results_digest(results):
+    """Content digest of a benchmark run, used to key the cached figures"""
+    digest = hashlib.blake2b(digest_size=16)
+    for key in ("base", "nse", "adaptive"):
+        run = results[key]
+        digest.update(
+            repr(
+                (run["name"], run["throughput"], run["avg_latency"], run["trades"])
+            ).encode()
+        )
+        digest.update(run["latency_hist"].tobytes())
+    return digest.hexdigest()
 
 
-def plot_throughput_comparison(results):
+@st.cache_resource(max_entries=16, show_spinner=False)
+def plot_throughput_comparison(results_key, _results):
     """Create throughput comparison bar chart"""
 
     engines = [
-        results["base"]["name"],
-        results["nse"]["name"],
-        results["adaptive"]["name"],
+        _results["base"]["name"],
+        _results["nse"]["name"],
+        _results["adaptive"]["name"],
     ]
     throughputs = [
-        results["base"]["throughput"],
-        results["nse"]["throughput"],
-        results["adaptive"]["throughput"],
+        _results["base"]["throughput"],
+        _results["nse"]["throughput"],
+        _results["adaptive"]["throughput"],
     ]
     colors = ["#636EFA", "#EF553B", "#00CC96"]
 
@@ -221,18 +166,19 @@ def plot_throughput_comparison(results):
     return fig
 
 
-def plot_latency_comparison(results):
+@st.cache_resource(max_entries=16, show_spinner=False)
+def plot_latency_comparison(results_key, _results):
     """Create latency comparison chart"""
 
     engines = [
-        results["base"]["name"],
-        results["nse"]["name"],
-        results["adaptive"]["name"],
+        _results["base"]["name"],
+        _results["nse"]["name"],
+        _results["adaptive"]["name"],
     ]
     latencies = [
-        results["base"]["avg_latency"],
-        results["nse"]["avg_latency"],
-        results["adaptive"]["avg_latency"],
+        _results["base"]["avg_latency"],
+        _results["nse"]["avg_latency"],
+        _results["adaptive"]["avg_latency"],
     ]
     colors = ["#636EFA", "#EF553B", "#00CC96"]
 
@@ -258,41 +204,40 @@ def plot_latency_comparison(results):
     return fig
 
 
-def plot_latency_distribution(results):
-    """Create latency distribution histogram"""
+@st.cache_resource(max_entries=16, show_spinner=False)
+def plot_latency_distribution(results_key, _results):
+    """Create latency distribution chart from log2 latency histograms"""
 
     fig = go.Figure()
 
-    fig.add_trace(
-        go.Histogram(
-            x=results["base"]["latencies"],
-            name=results["base"]["name"],
-            opacity=0.7,
-            marker_color="#636EFA",
-        )
+    # Only plot the range of buckets that actually received samples
+    occupied = np.flatnonzero(
+        _results["base"]["latency_hist"]
+        + _results["nse"]["latency_hist"]
+        + _results["adaptive"]["latency_hist"]
     )
-
-    fig.add_trace(
-        go.Histogram(
-            x=results["nse"]["latencies"],
-            name=results["nse"]["name"],
-            opacity=0.7,
-            marker_color="#EF553B",
-        )
-    )
-
-    fig.add_trace(
-        go.Histogram(
-            x=results["adaptive"]["latencies"],
-            name=results["adaptive"]["name"],
-            opacity=0.7,
-            marker_color="#00CC96",
+    lo, hi = occupied[0], occupied[-1] + 1
+
+    for key, color in (
+        ("base", "#636EFA"),
+        ("nse", "#EF553B"),
+        ("adaptive", "#00CC96"),
+    ):
+        fig.add_trace(
+            go.Bar(
+                x=LATENCY_BUCKET_LABELS[lo:hi],
+                y=_results[key]["latency_hist"][lo:hi],
+                name=_results[key]["name"],
+                opacity=0.7,
+                marker_color=color,
+            )
         )
-    )
 
     fig.update_layout(
         title="Latency Distribution",
-        xaxis_title="Latency (ms)",
+        # One evenly spaced slot per log2 bucket, labelled with its range
+        xaxis_title="Latency (ms, log2 buckets)",
+        xaxis_type="category",
         yaxis_title="Frequency",
         barmode="overlay",
         height=400,
@@ -301,66 +246,39 @@ def plot_latency_distribution(results):
     return fig
 
 
-def plot_performance_metrics(results):
+@st.cache_resource(max_entries=16, show_spinner=False)
+def plot_performance_metrics(results_key, _results):
     """Create radar chart comparing multiple metrics"""
 
-    # Normalize metrics to 0-100 scale
-    max_throughput = max(
-        results["base"]["throughput"],
-        results["nse"]["throughput"],
-        results["adaptive"]["throughput"],
-    )
-    max_trades = max(
-        results["base"]["trades"],
-        results["nse"]["trades"],
-        results["adaptive"]["trades"],
-    )
+    runs = [_results[kind] for kind in ENGINE_KINDS]
 
-    categories = ["Throughput", "Trade Execution", "Efficiency"]
+    # Normalize metrics to 0-100 scale in one pass per metric
+    throughputs = np.array([run["throughput"] for run in runs], dtype=float)
+    trades = np.array([run["trades"] for run in runs], dtype=float)
+    throughput_scores = throughputs / throughputs.max() * 100
+    trade_scores = trades / max(trades.max(), 1) * 100
 
-    fig = go.Figure()
+    # Base as reference; NSE slightly lower due to additional checks,
+    # adaptive lower due to regime detection
+    efficiency_scores = (100, 95, 90)
+    colors = ("#636EFA", "#EF553B", "#00CC96")
 
-    fig.add_trace(
-        go.Scatterpolar(
-            r=[
-                (results["base"]["throughput"] / max_throughput) * 100,
-                (results["base"]["trades"] / max_trades) * 100,
-                100,  # Base as reference
-            ],
-            theta=categories,
-            fill="toself",
-            name=results["base"]["name"],
-            line_color="#636EFA",
-        )
-    )
+    categories = ["Throughput", "Trade Execution", "Efficiency"]
 
-    fig.add_trace(
-        go.Scatterpolar(
-            r=[
-                (results["nse"]["throughput"] / max_throughput) * 100,
-                (results["nse"]["trades"] / max_trades) * 100,
-                95,  # Slightly lower due to additional checks
-            ],
-            theta=categories,
-            fill="toself",
-            name=results["nse"]["name"],
-            line_color="#EF553B",
-        )
-    )
+    fig = go.Figure()
 
-    fig.add_trace(
-        go.Scatterpolar(
-            r=[
-                (results["adaptive"]["throughput"] / max_throughput) * 100,
-                (results["adaptive"]["trades"] / max_trades) * 100,
-                90,  # Lower due to regime detection
-            ],
-            theta=categories,
-            fill="toself",
-            name=results["adaptive"]["name"],
-            line_color="#00CC96",
+    for run, throughput, trade, efficiency, color in zip(
+        runs, throughput_scores, trade_scores, efficiency_scores, colors
+    ):
+        fig.add_trace(
+            go.Scatterpolar(
+                r=[throughput, trade, efficiency],
+                theta=categories,
+                fill="toself",
+                name=run["name"],
+                line_color=color,
+            )
         )
-    )
 
     fig.update_layout(
         polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
@@ -372,6 +290,144 @@ def plot_performance_metrics(results):
     return fig
 
 
+@st.fragment
+def render_results(results):
+    """Render charts, tables and exports for a completed benchmark run"""
+    results_key = results_digest(results)
+
+    # Show adaptive configuration used
+    if "adaptive_config" in st.session_state:
+        with st.expander("🔧 View Adaptive Engine Configuration", expanded=False):
+            config = st.session_state.adaptive_config
+            config_data = {
+                "Parameter": [
+                    "Detection Interval",
+                    "Window Size",
+                    "Volatility Threshold",
+                    "Spread Threshold",
+                    "Imbalance Threshold",
+                    "Cancellation Threshold",
+                ],
+                "Value": [
+                    str(config.get("detection_interval", 100)),
+                    str(config.get("window_size", 100)),
+                    f"{config.get('volatility_threshold', 0.05):.2f}",
+                    f"{config.get('spread_threshold', 0.02):.3f}",
+                    f"{config.get('imbalance_threshold', 0.5):.2f}",
+                    f"{config.get('cancellation_threshold', 0.25):.2f}",
+                ],
+                "Description": [
+                    "Orders between regime checks",
+                    "Orders analyzed for metrics",
+                    "Triggers HIGH_VOLATILITY regime",
+                    "Triggers ILLIQUID regime",
+                    "Triggers DIRECTIONAL regime",
+                    "Triggers HIGH_FREQUENCY regime",
+                ],
+            }
+            config_df = pd.DataFrame(config_data)
+            st.dataframe(config_df, use_container_width=True, hide_index=True)
+
+    # Performance Comparison Charts
+    st.subheader("📊 Performance Comparison")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.plotly_chart(
+            plot_throughput_comparison(results_key, results), use_container_width=True
+        )
+
+    with col2:
+        st.plotly_chart(
+            plot_latency_comparison(results_key, results), use_container_width=True
+        )
+
+    # Latency Distribution
+    st.subheader("📉 Latency Distribution Analysis")
+    st.plotly_chart(
+        plot_latency_distribution(results_key, results), use_container_width=True
+    )
+
+    # Regime Analysis (if adaptive engine was tested)
+    if "regime_stats" in results.get("adaptive", {}):
+        st.subheader("🔄 Adaptive Engine Regime Analysis")
+
+        regime_stats = results["adaptive"]["regime_stats"]
+
+        st.markdown("#### Regime Distribution")
+        if regime_stats["regime_distribution"]:
+            regime_df = pd.DataFrame(
+                [
+                    {"Regime": regime, "Occurrences": count}
+                    for regime, count in regime_stats["regime_distribution"].items()
+                ]
+            )
+
+            fig = px.pie(
+                regime_df,
+                values="Occurrences",
+                names="Regime",
+                title="Time Spent in Each Regime",
+                color_discrete_sequence=px.colors.qualitative.Set3,
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No regime changes occurred during the test")
+
+    # Radar Chart
+    st.subheader("🎯 Overall Performance Radar")
+    st.plotly_chart(
+        plot_performance_metrics(results_key, results), use_container_width=True
+    )
+
+    # Detailed Statistics
+    st.subheader("📋 Detailed Statistics")
+
+    runs = [results[kind] for kind in ENGINE_KINDS]
+    comparison_df = pd.DataFrame(
+        {
+            "Engine": [run["name"] for run in runs],
+            "Throughput (ops/s)": [f"{run['throughput']:,.0f}" for run in runs],
+            "Avg Latency (ms)": [f"{run['avg_latency']:.4f}" for run in runs],
+            "P50 Latency (ms)": [f"{run['p50_latency']:.4f}" for run in runs],
+            "P95 Latency (ms)": [f"{run['p95_latency']:.4f}" for run in runs],
+            "P99 Latency (ms)": [f"{run['p99_latency']:.4f}" for run in runs],
+            "Total Time (s)": [f"{run['time']:.3f}" for run in runs],
+            "Trades Executed": [run["trades"] for run in runs],
+        }
+    )
+
+    st.dataframe(comparison_df, use_container_width=True)
+
+    # Download Results
+    st.subheader("💾 Export Results")
+
+    json_results = orjson.dumps(
+        results,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2,
+        default=str,
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            label="📥 Download JSON Results",
+            data=json_results,
+            file_name=f"benchmark_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json",
+        )
+
+    with col2:
+        csv_data = comparison_df.to_csv(index=False)
+        st.download_button(
+            label="📥 Download CSV Summary",
+            data=csv_data,
+            file_name=f"benchmark_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+        )
+
+
 def main():
     # Header
     st.markdown(
@@ -405,6 +461,14 @@ def main():
         format="%.3f",
     )
 
+    seed = st.sidebar.number_input(
+        "Random Seed",
+        min_value=0,
+        value=42,
+        step=1,
+        help="Same seed = same order stream (re-running a seen config is instant)",
+    )
+
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 🎛️ Adaptive Engine Configuration")
 
@@ -489,176 +553,20 @@ def main():
     )
 
     if st.sidebar.button("🚀 Run Benchmark", type="primary", use_container_width=True):
-        with st.spinner("Running benchmark..."):
-            results = run_benchmark(order_count, volatility, adaptive_config)
+        with st.spinner("Testing Base, NSE and Adaptive engines in parallel..."):
+            results = cached_benchmark(
+                order_count,
+                volatility,
+                tuple(sorted(adaptive_config.items())),
+                int(seed),
+            )
             st.session_state.benchmark_results = results
             st.session_state.adaptive_config = adaptive_config  # Store config
             st.success("✅ Benchmark completed successfully!")
 
     # Display results if available
     if st.session_state.benchmark_results:
-        results = st.session_state.benchmark_results
-
-        # Show adaptive configuration used
-        if "adaptive_config" in st.session_state:
-            with st.expander("🔧 View Adaptive Engine Configuration", expanded=False):
-                config_data = []
-                config_data.append(
-                    {
-                        "Parameter": "Detection Interval",
-                        "Value": str(
-                            st.session_state.adaptive_config.get(
-                                "detection_interval", 100
-                            )
-                        ),
-                        "Description": "Orders between regime checks",
-                    }
-                )
-                config_data.append(
-                    {
-                        "Parameter": "Window Size",
-                        "Value": str(
-                            st.session_state.adaptive_config.get("window_size", 100)
-                        ),
-                        "Description": "Orders analyzed for metrics",
-                    }
-                )
-                config_data.append(
-                    {
-                        "Parameter": "Volatility Threshold",
-                        "Value": f"{st.session_state.adaptive_config.get('volatility_threshold', 0.05):.2f}",
-                        "Description": "Triggers HIGH_VOLATILITY regime",
-                    }
-                )
-                config_data.append(
-                    {
-                        "Parameter": "Spread Threshold",
-                        "Value": f"{st.session_state.adaptive_config.get('spread_threshold', 0.02):.3f}",
-                        "Description": "Triggers ILLIQUID regime",
-                    }
-                )
-                config_data.append(
-                    {
-                        "Parameter": "Imbalance Threshold",
-                        "Value": f"{st.session_state.adaptive_config.get('imbalance_threshold', 0.5):.2f}",
-                        "Description": "Triggers DIRECTIONAL regime",
-                    }
-                )
-                config_data.append(
-                    {
-                        "Parameter": "Cancellation Threshold",
-                        "Value": f"{st.session_state.adaptive_config.get('cancellation_threshold', 0.25):.2f}",
-                        "Description": "Triggers HIGH_FREQUENCY regime",
-                    }
-                )
-                config_df = pd.DataFrame(config_data)
-                st.dataframe(config_df, use_container_width=True, hide_index=True)
-
-        # Performance Comparison Charts
-        st.subheader("📊 Performance Comparison")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.plotly_chart(
-                plot_throughput_comparison(results), use_container_width=True
-            )
-
-        with col2:
-            st.plotly_chart(plot_latency_comparison(results), use_container_width=True)
-
-        # Latency Distribution
-        st.subheader("📉 Latency Distribution Analysis")
-        st.plotly_chart(plot_latency_distribution(results), use_container_width=True)
-
-        # Regime Analysis (if adaptive engine was tested)
-        if "regime_stats" in results.get("adaptive", {}):
-            st.subheader("🔄 Adaptive Engine Regime Analysis")
-
-            regime_stats = results["adaptive"]["regime_stats"]
-
-            st.markdown("#### Regime Distribution")
-            if regime_stats["regime_distribution"]:
-                regime_df = pd.DataFrame(
-                    [
-                        {"Regime": regime, "Occurrences": count}
-                        for regime, count in regime_stats["regime_distribution"].items()
-                    ]
-                )
-
-                fig = px.pie(
-                    regime_df,
-                    values="Occurrences",
-                    names="Regime",
-                    title="Time Spent in Each Regime",
-                    color_discrete_sequence=px.colors.qualitative.Set3,
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("No regime changes occurred during the test")
-
-        # Radar Chart
-        st.subheader("🎯 Overall Performance Radar")
-        st.plotly_chart(plot_performance_metrics(results), use_container_width=True)
-
-        # Detailed Statistics
-        st.subheader("📋 Detailed Statistics")
-
-        comparison_df = pd.DataFrame(
-            {
-                "Engine": [
-                    results["base"]["name"],
-                    results["nse"]["name"],
-                    results["adaptive"]["name"],
-                ],
-                "Throughput (ops/s)": [
-                    f"{results['base']['throughput']:,.0f}",
-                    f"{results['nse']['throughput']:,.0f}",
-                    f"{results['adaptive']['throughput']:,.0f}",
-                ],
-                "Avg Latency (ms)": [
-                    f"{results['base']['avg_latency']:.4f}",
-                    f"{results['nse']['avg_latency']:.4f}",
-                    f"{results['adaptive']['avg_latency']:.4f}",
-                ],
-                "Total Time (s)": [
-                    f"{results['base']['time']:.3f}",
-                    f"{results['nse']['time']:.3f}",
-                    f"{results['adaptive']['time']:.3f}",
-                ],
-                "Trades Executed": [
-                    results["base"]["trades"],
-                    results["nse"]["trades"],
-                    results["adaptive"]["trades"],
-                ],
-            }
-        )
-
-        st.dataframe(comparison_df, use_container_width=True)
-
-        # Download Results
-        st.subheader("💾 Export Results")
-
-        json_results = json.dumps(results, indent=2, default=str)
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.download_button(
-                label="📥 Download JSON Results",
-                data=json_results,
-                file_name=f"benchmark_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json",
-            )
-
-        with col2:
-            csv_data = comparison_df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download CSV Summary",
-                data=csv_data,
-                file_name=f"benchmark_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-            )
-
+        render_results(st.session_state.benchmark_results)
     else:
         # Initial state - show instructions
         st.info(
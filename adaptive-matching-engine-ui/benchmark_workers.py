@@ -0,0 +1,142 @@
+"""
+Benchmark workers for the performance dashboard.
+
+These live outside app.py so they can be pickled into a process pool:
+functions defined inside the Streamlit script are not importable by workers.
+"""
+
+import sys
+import os
+import time
+import numpy as np
+
+# Add parent directory to path to import matching engine
+sys.path.insert(
+    0,
+    os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "adaptive-matching-engine")
+    ),
+)
+
+from src.core.matching_engine import AdaptiveMatchingEngine, BaseMatchingEngine
+from src.core.nse_matching_engine import NSEMatchingEngine
+from src.data.order_generator import OrderGenerator
+
+ENGINE_KINDS = ("base", "nse", "adaptive")
+ENGINE_NAMES = {
+    "base": "Base Engine (Simple Price-Time)",
+    "nse": "NSE Traditional Engine",
+    "adaptive": "Adaptive Engine",
+}
+
+# Orders pushed through a throwaway engine before each timed run
+WARMUP_ORDERS = 256
+
+# Latencies are aggregated into log2(ns) buckets: bucket i holds [2**(i-1), 2**i) ns
+LATENCY_BUCKETS = 64
+LATENCY_BUCKET_UPPER_MS = 2.0 ** np.arange(LATENCY_BUCKETS) * 1e-6
+LATENCY_BUCKET_LABELS = [
+    f"{upper / 2:.3g}–{upper:.3g}" for upper in LATENCY_BUCKET_UPPER_MS.tolist()
+]
+
+
+def latency_histogram(latencies_ns):
+    """Aggregate per-order latencies (ns) into a fixed-size log2 histogram"""
+    # frexp exponent == int.bit_length() for non-negative integers
+    buckets = np.minimum(np.frexp(latencies_ns)[1], LATENCY_BUCKETS - 1)
+    return np.bincount(buckets, minlength=LATENCY_BUCKETS).astype(np.uint32)
+
+
+def summarize_latencies(latencies_ns):
+    """Reduce raw latencies to mean, percentiles and histogram (O(bins) to keep)"""
+    p50, p95, p99 = np.percentile(latencies_ns, [50, 95, 99]) * 1e-6
+    return {
+        "avg_latency": float(latencies_ns.mean()) * 1e-6,
+        "p50_latency": float(p50),
+        "p95_latency": float(p95),
+        "p99_latency": float(p99),
+        "latency_hist": latency_histogram(latencies_ns),
+    }
+
+
+def run_engine_batch(engine, orders):
+    """Process a batch of orders, returning per-order latencies (ns) and trade count"""
+    latencies = np.empty(len(orders), dtype=np.int64)
+
+    # Every engine appends to trade_history, so the trade count is read once
+    # from it instead of summing len(trades) inside the timed loop
+    trades_before = len(engine.trade_history)
+
+    # Bind the hot callables once so the loop body is local lookups only
+    process_order = engine.process_order
+    clock = time.perf_counter_ns
+
+    for i, order in enumerate(orders):
+        t0 = clock()
+        process_order(order)
+        latencies[i] = clock() - t0
+
+    return latencies, len(engine.trade_history) - trades_before
+
+
+def slice_batch(batch, limit):
+    """Take the first `limit` orders of a generate_orders_soa batch"""
+    return {k: v[:limit] if isinstance(v, np.ndarray) else v for k, v in batch.items()}
+
+
+def create_engine(kind, adaptive_config=None):
+    """Create a fresh engine of the given kind, configured for the benchmark"""
+    if kind == "base":
+        return BaseMatchingEngine()
+    if kind == "nse":
+        engine = NSEMatchingEngine(symbol="NIFTY")
+        engine.set_reference_price(18500.0)
+        return engine
+    if kind == "adaptive":
+        return AdaptiveMatchingEngine(config=adaptive_config)
+    raise ValueError(f"Unknown engine kind: {kind}")
+
+
+def warm_up_engine(kind, batch, adaptive_config=None):
+    """
+    Push a short prefix of the order stream through a throwaway engine.
+
+    This pays the cold-cache / first-call costs outside the timed region;
+    the engine that is actually measured starts from a clean state.
+    """
+    warmup_orders = OrderGenerator.orders_from_soa(slice_batch(batch, WARMUP_ORDERS))
+    run_engine_batch(create_engine(kind, adaptive_config), warmup_orders)
+
+
+def benchmark_engine(kind, batch, adaptive_config=None):
+    """Warm up, then time one engine over the batch and return its results entry"""
+    warm_up_engine(kind, batch, adaptive_config)
+
+    engine = create_engine(kind, adaptive_config)
+    orders = OrderGenerator.orders_from_soa(batch)
+
+    start = time.perf_counter()
+    latencies, trades = run_engine_batch(engine, orders)
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "name": ENGINE_NAMES[kind],
+        "time": elapsed,
+        "throughput": len(orders) / elapsed,
+        "trades": trades,
+        **summarize_latencies(latencies),
+    }
+
+    if kind == "nse":
+        result["circuit_breakers"] = engine.get_statistics()["circuit_breaker_hits"]
+    elif kind == "adaptive":
+        result.update(
+            {
+                "regime_changes": engine.regime_change_count,
+                "final_regime": engine.current_regime.value,
+                "regime_stats": engine.get_regime_statistics(),
+                "config": engine.get_config(),
+            }
+        )
+
+    return result
@@ -78,6 +78,9 @@ REGIME_POLICIES = {
 }
 
 
+_DEFAULT_REGIME_POLICY = REGIME_POLICIES["NORMAL"]
+
+
 def get_config():
     """Get the default configuration"""
     return DEFAULT_CONFIG.copy()
@@ -85,4 +88,4 @@ def get_config():
 
 def get_regime_policy(regime: str):
     """Get the policy for a specific regime"""
-    return REGIME_POLICIES.get(regime, REGIME_POLICIES["NORMAL"])
+    return REGIME_POLICIES.get(regime, _DEFAULT_REGIME_POLICY)
@@ -3,15 +3,21 @@ Demonstration of Adaptive Matching Engine Flexibility
 Shows various configuration options and their effects
 """
 
+import argparse
 import sys
 import os
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# Running as a script rather than `python -m examples.<name>`: make the
+# project root importable so `src` resolves
+if not __package__:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.core.matching_engine import AdaptiveMatchingEngine
 from src.data.order_generator import OrderGenerator
 from src.core.order_types import MarketRegime
+from src.utils.performance import warm_up_engine
+from contextlib import redirect_stdout
+import io
 import time
 
 
@@ -22,46 +28,71 @@ def print_section(title):
     print("=" * 70)
 
 
-def test_default_config():
-    """Test with default configuration"""
-    print_section("Test 1: Default Configuration")
+# One generator shared by every scenario instead of a fresh one per test
+GENERATOR = OrderGenerator(price_range=(18000.0, 19000.0))
 
-    engine = AdaptiveMatchingEngine()
-    config = engine.get_config()
+# Order counts used with --full; the default quick run uses --size for all
+ORDER_COUNT = 1000
+BENCHMARK_ORDER_COUNT = 5000
+QUICK_ORDER_COUNT = 500
 
-    print("\nDefault Configuration:")
-    for key, value in config.items():
-        print(f"  {key}: {value}")
 
-    # Generate and process orders
-    generator = OrderGenerator(price_range=(18000.0, 19000.0))
-    orders = generator.generate_orders(1000, volatility=0.02)
+def run_scenario(engine, volatility, order_count=ORDER_COUNT):
+    """Warm up the engine, then time it over a fresh batch of orders"""
+    orders = GENERATOR.generate_orders(order_count, volatility=volatility)
+
+    warm_up_engine(engine)
+    # Swallow any engine output so terminal I/O stays out of the measurement
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        total_trades = len(engine.process_orders(orders))
+        elapsed = time.perf_counter() - start
+
+    return total_trades, elapsed
+
 
-    start = time.perf_counter()
-    total_trades = 0
+def run_config_test(title, label, config, volatility, order_count=ORDER_COUNT):
+    """Run one configuration scenario and print its results"""
+    print_section(title)
 
-    for order in orders:
-        trades = engine.process_order(order)
-        total_trades += len(trades)
+    engine = AdaptiveMatchingEngine(config=config)
+
+    print(f"\n{label}:")
+    for key, value in (config or engine.get_config()).items():
+        print(f"  {key}: {value}")
 
-    elapsed = time.perf_counter() - start
+    total_trades, elapsed = run_scenario(engine, volatility, order_count)
 
     # Get statistics
     stats = engine.get_regime_statistics()
 
     print(f"\nResults:")
-    print(f"  Orders Processed: 1,000")
+    print(f"  Orders Processed: {order_count:,}")
     print(f"  Total Trades: {total_trades:,}")
     print(f"  Processing Time: {elapsed:.3f}s")
-    print(f"  Throughput: {1000/elapsed:,.0f} ops/s")
+    print(f"  Throughput: {order_count/elapsed:,.0f} ops/s")
     print(f"  Regime Changes: {stats['total_changes']}")
     print(f"  Final Regime: {stats['current_regime']}")
 
+    if stats["regime_distribution"]:
+        print(f"\n  Regime Distribution:")
+        for regime, count in stats["regime_distribution"].items():
+            print(f"    {regime}: {count} changes")
+
+
+def test_default_config(order_count=ORDER_COUNT):
+    """Test with default configuration"""
+    run_config_test(
+        "Test 1: Default Configuration",
+        "Default Configuration",
+        config=None,
+        volatility=0.02,
+        order_count=order_count,
+    )
 
-def test_high_sensitivity():
-    """Test with high sensitivity configuration"""
-    print_section("Test 2: High Sensitivity Configuration (Volatile Markets)")
 
+def test_high_sensitivity(order_count=ORDER_COUNT):
+    """Test with high sensitivity configuration"""
     config = {
         "detection_interval": 50,  # Check more frequently
         "window_size": 100,
@@ -71,46 +102,18 @@ def test_high_sensitivity():
         "cancellation_threshold": 0.15,
     }
 
-    engine = AdaptiveMatchingEngine(config=config)
-
-    print("\nHigh Sensitivity Configuration:")
-    for key, value in config.items():
-        print(f"  {key}: {value}")
-
-    # Generate more volatile orders
-    generator = OrderGenerator(price_range=(18000.0, 19000.0))
-    orders = generator.generate_orders(1000, volatility=0.03)
-
-    start = time.perf_counter()
-    total_trades = 0
-
-    for order in orders:
-        trades = engine.process_order(order)
-        total_trades += len(trades)
-
-    elapsed = time.perf_counter() - start
-
-    # Get statistics
-    stats = engine.get_regime_statistics()
-
-    print(f"\nResults:")
-    print(f"  Orders Processed: 1,000")
-    print(f"  Total Trades: {total_trades:,}")
-    print(f"  Processing Time: {elapsed:.3f}s")
-    print(f"  Throughput: {1000/elapsed:,.0f} ops/s")
-    print(f"  Regime Changes: {stats['total_changes']}")
-    print(f"  Final Regime: {stats['current_regime']}")
-
-    if stats["regime_distribution"]:
-        print(f"\n  Regime Distribution:")
-        for regime, count in stats["regime_distribution"].items():
-            print(f"    {regime}: {count} changes")
+    # More volatile orders
+    run_config_test(
+        "Test 2: High Sensitivity Configuration (Volatile Markets)",
+        "High Sensitivity Configuration",
+        config=config,
+        volatility=0.03,
+        order_count=order_count,
+    )
 
 
-def test_low_sensitivity():
+def test_low_sensitivity(order_count=ORDER_COUNT):
     """Test with low sensitivity configuration"""
-    print_section("Test 3: Low Sensitivity Configuration (Stable Markets)")
-
     config = {
         "detection_interval": 200,  # Check less frequently
         "window_size": 100,
@@ -120,35 +123,14 @@ def test_low_sensitivity():
         "cancellation_threshold": 0.4,
     }
 
-    engine = AdaptiveMatchingEngine(config=config)
-
-    print("\nLow Sensitivity Configuration:")
-    for key, value in config.items():
-        print(f"  {key}: {value}")
-
-    # Generate stable orders
-    generator = OrderGenerator(price_range=(18000.0, 19000.0))
-    orders = generator.generate_orders(1000, volatility=0.01)
-
-    start = time.perf_counter()
-    total_trades = 0
-
-    for order in orders:
-        trades = engine.process_order(order)
-        total_trades += len(trades)
-
-    elapsed = time.perf_counter() - start
-
-    # Get statistics
-    stats = engine.get_regime_statistics()
-
-    print(f"\nResults:")
-    print(f"  Orders Processed: 1,000")
-    print(f"  Total Trades: {total_trades:,}")
-    print(f"  Processing Time: {elapsed:.3f}s")
-    print(f"  Throughput: {1000/elapsed:,.0f} ops/s")
-    print(f"  Regime Changes: {stats['total_changes']}")
-    print(f"  Final Regime: {stats['current_regime']}")
+    # Stable orders
+    run_config_test(
+        "Test 3: Low Sensitivity Configuration (Stable Markets)",
+        "Low Sensitivity Configuration",
+        config=config,
+        volatility=0.01,
+        order_count=order_count,
+    )
 
 
 def test_dynamic_updates():
@@ -179,7 +161,7 @@ def test_dynamic_updates():
     print(f"  Spread Threshold: {config['spread_threshold']}")
 
 
-def test_benchmark_mode():
+def test_benchmark_mode(order_count=BENCHMARK_ORDER_COUNT):
     """Test benchmark mode (no adaptive features)"""
     print_section("Test 5: Benchmark Mode (Maximum Performance)")
 
@@ -191,29 +173,33 @@ def test_benchmark_mode():
         config={"enable_regime_detection": False}, benchmark_mode=True
     )
 
-    generator = OrderGenerator(price_range=(18000.0, 19000.0))
-    orders = generator.generate_orders(5000, volatility=0.01)
+    # Draw the stream once; each engine gets its own Order objects built from
+    # the same columns (orders are mutated while matching)
+    batch = GENERATOR.generate_orders_soa(order_count, volatility=0.01)
+    orders = OrderGenerator.orders_from_soa(batch)
 
     # Test adaptive mode
     print("\nAdaptive Mode:")
-    start = time.perf_counter()
-    for order in orders:
-        engine_adaptive.process_order(order)
-    adaptive_time = time.perf_counter() - start
+    warm_up_engine(engine_adaptive)
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        engine_adaptive.process_orders(orders)
+        adaptive_time = time.perf_counter() - start
 
     print(f"  Processing Time: {adaptive_time:.3f}s")
-    print(f"  Throughput: {5000/adaptive_time:,.0f} ops/s")
+    print(f"  Throughput: {order_count/adaptive_time:,.0f} ops/s")
 
     # Test benchmark mode
     print("\nBenchmark Mode:")
-    orders_benchmark = generator.generate_orders(5000, volatility=0.01)
-    start = time.perf_counter()
-    for order in orders_benchmark:
-        engine_benchmark.process_order(order)
-    benchmark_time = time.perf_counter() - start
+    orders_benchmark = OrderGenerator.orders_from_soa(batch)
+    warm_up_engine(engine_benchmark)
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        engine_benchmark.process_orders(orders_benchmark)
+        benchmark_time = time.perf_counter() - start
 
     print(f"  Processing Time: {benchmark_time:.3f}s")
-    print(f"  Throughput: {5000/benchmark_time:,.0f} ops/s")
+    print(f"  Throughput: {order_count/benchmark_time:,.0f} ops/s")
 
     # Comparison
     speedup = adaptive_time / benchmark_time
@@ -222,7 +208,7 @@ def test_benchmark_mode():
     print(f"  Adaptive overhead: {(speedup-1)*100:.1f}%")
 
 
-def test_custom_scenarios():
+def test_custom_scenarios(order_count=ORDER_COUNT):
     """Test custom market scenarios"""
     print_section("Test 6: Custom Market Scenarios")
 
@@ -264,35 +250,53 @@ def test_custom_scenarios():
         print(f"  Configuration: {scenario['config']}")
 
         engine = AdaptiveMatchingEngine(config=scenario["config"])
-        generator = OrderGenerator(price_range=(18000.0, 19000.0))
-        orders = generator.generate_orders(1000, volatility=scenario["volatility"])
-
-        start = time.perf_counter()
-        for order in orders:
-            engine.process_order(order)
-        elapsed = time.perf_counter() - start
+        _, elapsed = run_scenario(engine, scenario["volatility"], order_count)
 
         stats = engine.get_regime_statistics()
 
-        print(f"  Throughput: {1000/elapsed:,.0f} ops/s")
+        print(f"  Throughput: {order_count/elapsed:,.0f} ops/s")
         print(f"  Regime Changes: {stats['total_changes']}")
         print(f"  Final Regime: {stats['current_regime']}")
 
 
-def main():
+def parse_args(argv=None):
+    """Parse the order-count flags for the demo"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=QUICK_ORDER_COUNT,
+        help="orders per scenario and benchmark run (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help=f"use the full counts ({ORDER_COUNT} per scenario, "
+        f"{BENCHMARK_ORDER_COUNT} for the benchmark), ignoring --size",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Run all flexibility demonstrations"""
+    args = parse_args(argv)
+    if args.full:
+        scenario_count, benchmark_count = ORDER_COUNT, BENCHMARK_ORDER_COUNT
+    else:
+        scenario_count = benchmark_count = args.size
+
     print("\n" + "=" * 70)
     print("  ADAPTIVE MATCHING ENGINE - FLEXIBILITY DEMONSTRATION")
     print("=" * 70)
     print("\nThis demo shows various configuration options and their effects")
     print("on performance and regime detection behavior.\n")
 
-    test_default_config()
-    test_high_sensitivity()
-    test_low_sensitivity()
+    test_default_config(scenario_count)
+    test_high_sensitivity(scenario_count)
+    test_low_sensitivity(scenario_count)
     test_dynamic_updates()
-    test_benchmark_mode()
-    test_custom_scenarios()
+    test_benchmark_mode(benchmark_count)
+    test_custom_scenarios(scenario_count)
 
     print("\n" + "=" * 70)
     print("  DEMONSTRATION COMPLETE")
@@ -6,13 +6,18 @@ Fast Nifty analysis with optimized performance
 import sys
 import os
 
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+# Running as a script rather than `python -m examples.<name>`: make the
+# project root importable so `src` resolves
+if not __package__:
+    sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 from src.core.matching_engine import AdaptiveMatchingEngine, BaseMatchingEngine
 from src.core.order_types import Order, OrderSide, OrderType
-from src.utils.performance import PerformanceMonitor
+from src.utils.performance import PerformanceMonitor, warm_up_engine
 from src.data.nifty_loader import NiftyDataLoader
+import io
 import time
+from contextlib import redirect_stdout
 from datetime import datetime
 
 
@@ -51,33 +56,24 @@ class FastNiftyAnalysis:
         adaptive_monitor = PerformanceMonitor(adaptive_engine)
 
         print("🔄 Testing ADAPTIVE engine...")
-        adaptive_start = time.time()
-        adaptive_trades = []
-
-        for i, order in enumerate(orders):
-            trades = adaptive_engine.process_order(order)
-            adaptive_trades.extend(trades)
-
-            # Progress every 100 orders
-            if (i + 1) % 100 == 0:
-                elapsed = time.time() - adaptive_start
-                print(f"  Processed {i+1}/{len(orders)} orders ({elapsed:.1f}s)")
-
-        adaptive_time = time.time() - adaptive_start
+        warm_up_engine(adaptive_engine)
+        with redirect_stdout(io.StringIO()):
+            adaptive_start = time.perf_counter_ns()
+            adaptive_engine.process_orders(orders)
+            adaptive_time = (time.perf_counter_ns() - adaptive_start) / 1e9
+        adaptive_trade_count = len(adaptive_engine.trade_history)
 
         # Test Static Engine
         static_engine = BaseMatchingEngine()
         static_monitor = PerformanceMonitor(static_engine)
 
         print("🔄 Testing STATIC engine...")
-        static_start = time.time()
-        static_trades = []
-
-        for i, order in enumerate(orders):
-            trades = static_engine.process_order(order)
-            static_trades.extend(trades)
-
-        static_time = time.time() - static_start
+        warm_up_engine(static_engine)
+        with redirect_stdout(io.StringIO()):
+            static_start = time.perf_counter_ns()
+            static_engine.process_orders(orders)
+            static_time = (time.perf_counter_ns() - static_start) / 1e9
+        static_trade_count = len(static_engine.trade_history)
 
         # Results
         print("\n📈 RESULTS:")
@@ -85,14 +81,14 @@ class FastNiftyAnalysis:
         print(f"Adaptive Engine:")
         print(f"  Time: {adaptive_time:.2f}s")
         print(f"  Throughput: {len(orders)/adaptive_time:.1f} orders/sec")
-        print(f"  Trades: {len(adaptive_trades)}")
+        print(f"  Trades: {adaptive_trade_count}")
         print(f"  Regime Changes: {adaptive_engine.regime_change_count}")
         print(f"  Final Regime: {adaptive_engine.current_regime.value}")
 
         print(f"\nStatic Engine:")
         print(f"  Time: {static_time:.2f}s")
         print(f"  Throughput: {len(orders)/static_time:.1f} orders/sec")
-        print(f"  Trades: {len(static_trades)}")
+        print(f"  Trades: {static_trade_count}")
 
         # Comparison
         if static_time > 0:
@@ -108,13 +104,13 @@ class FastNiftyAnalysis:
         return {
             "adaptive": {
                 "time": adaptive_time,
-                "trades": len(adaptive_trades),
+                "trades": adaptive_trade_count,
                 "throughput": len(orders) / adaptive_time,
                 "regime_changes": adaptive_engine.regime_change_count,
             },
             "static": {
                 "time": static_time,
-                "trades": len(static_trades),
+                "trades": static_trade_count,
                 "throughput": len(orders) / static_time,
             },
         }
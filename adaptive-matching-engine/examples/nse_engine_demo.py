@@ -12,7 +12,10 @@ Demonstrates the features of the NSE-style matching engine including:
 import sys
 import os
 
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+# Running as a script rather than `python -m examples.<name>`: make the
+# project root importable so `src` resolves
+if not __package__:
+    sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 from src.core.nse_matching_engine import NSEMatchingEngine
 from src.core.order_types import (
@@ -38,20 +41,21 @@ def demo_call_auction():
     print("Phase: PRE-OPEN AUCTION")
     print("Accumulating orders...\n")
 
-    # Add buy orders
-    buy1 = Order("B1", OrderSide.BUY, 18010.0, 100, time.time())
-    buy2 = Order("B2", OrderSide.BUY, 18005.0, 200, time.time())
-    buy3 = Order("B3", OrderSide.BUY, 18000.0, 150, time.time())
-
-    # Add sell orders
-    sell1 = Order("S1", OrderSide.SELL, 18005.0, 120, time.time())
-    sell2 = Order("S2", OrderSide.SELL, 18010.0, 180, time.time())
-    sell3 = Order("S3", OrderSide.SELL, 18015.0, 100, time.time())
-
-    orders = [buy1, buy2, buy3, sell1, sell2, sell3]
-
+    # One base timestamp; small offsets keep the arrival order explicit
+    base = time.time()
+    orders = [
+        # Buy orders
+        Order("B1", OrderSide.BUY, 18010.0, 100, base),
+        Order("B2", OrderSide.BUY, 18005.0, 200, base + 1e-6),
+        Order("B3", OrderSide.BUY, 18000.0, 150, base + 2e-6),
+        # Sell orders
+        Order("S1", OrderSide.SELL, 18005.0, 120, base + 3e-6),
+        Order("S2", OrderSide.SELL, 18010.0, 180, base + 4e-6),
+        Order("S3", OrderSide.SELL, 18015.0, 100, base + 5e-6),
+    ]
+
+    engine.process_orders(orders)
     for order in orders:
-        engine.process_order(order)
         print(f"  Added: {order.side.value} {order.quantity}@{order.price}")
 
     print("\nExecuting call auction...")
@@ -265,12 +269,17 @@ def demo_statistics():
     engine.set_reference_price(18000.0)
     engine.set_trading_phase(TradingPhase.CONTINUOUS)
 
-    # Generate some activity
+    # Generate some activity: interleaved buy/sell pairs seeded as one batch
+    base = time.time()
+    orders = []
     for i in range(10):
-        buy = Order(f"B{i}", OrderSide.BUY, 18000.0 - i, 100, time.time())
-        sell = Order(f"S{i}", OrderSide.SELL, 18000.0 + i, 100, time.time())
-        engine.process_order(buy)
-        engine.process_order(sell)
+        orders.append(
+            Order(f"B{i}", OrderSide.BUY, 18000.0 - i, 100, base + 2 * i * 1e-6)
+        )
+        orders.append(
+            Order(f"S{i}", OrderSide.SELL, 18000.0 + i, 100, base + (2 * i + 1) * 1e-6)
+        )
+    engine.process_orders(orders)
 
     stats = engine.get_statistics()
 
@@ -3,17 +3,30 @@
 Test to demonstrate sharding benefits with parallel cancellations
 """
 
+import argparse
 import sys
 import time
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
-import threading
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Running as a script rather than `python -m examples.<name>`: make the
+# project root importable so `src` resolves
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.matching_engine import AdaptiveMatchingEngine
 from src.core.sharded_matching_engine import ShardedAdaptiveMatchingEngine
 from src.data.order_generator import OrderGenerator
+from src.utils.performance import warm_up_engine
+
+
+def check_cancellations(cancelled, requested):
+    """Fail if no resting order was cancelled: the timing would be meaningless"""
+    if cancelled == 0:
+        raise RuntimeError(
+            f"Cancelled 0/{requested} orders: every selected order had already "
+            "filled, so the timed loop measured only failed lookups"
+        )
 
 
 def test_parallel_cancellations(num_orders=10000, cancel_pct=50, num_threads=4):
@@ -30,8 +43,11 @@ def test_parallel_cancellations(num_orders=10000, cancel_pct=50, num_threads=4):
     # Generate orders
     print("Generating orders...")
     generator = OrderGenerator()
-    orders_standard = generator.generate_orders(count=num_orders)
-    orders_sharded = generator.generate_orders(count=num_orders)
+    # One vectorized draw; each engine gets its own Order objects (they are
+    # mutated while matching) built from the same columns
+    batch = generator.generate_orders_soa(num_orders)
+    orders_standard = OrderGenerator.orders_from_soa(batch)
+    orders_sharded = OrderGenerator.orders_from_soa(batch)
     print(f"Generated {len(orders_standard)} orders\n")
 
     # Test Standard Engine
@@ -41,23 +57,20 @@ def test_parallel_cancellations(num_orders=10000, cancel_pct=50, num_threads=4):
     standard_engine = AdaptiveMatchingEngine()
 
     # Add all orders
+    warm_up_engine(standard_engine)
     start_add = time.perf_counter()
-    for order in orders_standard:
-        standard_engine.process_order(order)
+    standard_engine.process_orders(orders_standard)
     add_elapsed = time.perf_counter() - start_add
 
     # Collect order IDs to cancel
-    all_order_ids = [o.order_id for o in orders_standard]
-    num_to_cancel = int(len(all_order_ids) * cancel_pct / 100)
-    cancel_ids = all_order_ids[:num_to_cancel]
+    num_to_cancel = int(len(orders_standard) * cancel_pct / 100)
+    cancel_ids = [o.order_id for o in orders_standard[:num_to_cancel]]
 
     # Sequential cancellation
     start_cancel = time.perf_counter()
-    cancelled = 0
-    for order_id in cancel_ids:
-        if standard_engine.cancel_order(order_id):
-            cancelled += 1
+    cancelled = standard_engine.cancel_orders(cancel_ids)
     cancel_elapsed = time.perf_counter() - start_cancel
+    check_cancellations(cancelled, num_to_cancel)
 
     standard_throughput = num_to_cancel / cancel_elapsed if cancel_elapsed > 0 else 0
 
@@ -73,39 +86,36 @@ def test_parallel_cancellations(num_orders=10000, cancel_pct=50, num_threads=4):
     sharded_engine = ShardedAdaptiveMatchingEngine(num_shards=8)
 
     # Add all orders
+    warm_up_engine(sharded_engine)
     start_add = time.perf_counter()
-    for order in orders_sharded:
-        sharded_engine.process_order(order)
+    sharded_engine.process_orders(orders_sharded)
     add_elapsed = time.perf_counter() - start_add
 
     # Collect order IDs to cancel
-    all_order_ids = [o.order_id for o in orders_sharded]
-    num_to_cancel = int(len(all_order_ids) * cancel_pct / 100)
-    cancel_ids = all_order_ids[:num_to_cancel]
-
-    # Parallel cancellation using ThreadPoolExecutor
-    cancelled_count = threading.Lock()
-    cancelled = 0
-
-    def cancel_batch(ids):
-        nonlocal cancelled
-        local_count = 0
-        for order_id in ids:
-            if sharded_engine.cancel_order(order_id):
-                local_count += 1
-        with cancelled_count:
-            cancelled += local_count
-
-    # Split cancellations across threads
-    batch_size = len(cancel_ids) // num_threads
+    num_to_cancel = int(len(orders_sharded) * cancel_pct / 100)
+    cancel_ids = [o.order_id for o in orders_sharded[:num_to_cancel]]
+
+    # Bucket cancellations by shard so each task touches a single shard and
+    # concurrent tasks never contend for the same shard lock
+    shard_of = sharded_engine.shard_of
+    shard_buckets = [[] for _ in range(sharded_engine.num_shards)]
+    for order_id in cancel_ids:
+        shard_buckets[shard_of(order_id)].append(order_id)
+
+    # Exactly one batch per worker: worker w owns shards w, w + num_threads, ...
     batches = [
-        cancel_ids[i : i + batch_size] for i in range(0, len(cancel_ids), batch_size)
+        [order_id for bucket in shard_buckets[w::num_threads] for order_id in bucket]
+        for w in range(num_threads)
     ]
 
+    # Parallel cancellation using ThreadPoolExecutor. Each worker returns its
+    # own count, so no shared counter or lock is touched while cancelling.
+    # Note the engine is pure Python: worker threads still share the GIL.
     start_cancel = time.perf_counter()
     with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        executor.map(cancel_batch, batches)
+        cancelled = sum(executor.map(sharded_engine.cancel_orders, batches))
     cancel_elapsed = time.perf_counter() - start_cancel
+    check_cancellations(cancelled, num_to_cancel)
 
     sharded_throughput = num_to_cancel / cancel_elapsed if cancel_elapsed > 0 else 0
 
@@ -136,6 +146,20 @@ def test_parallel_cancellations(num_orders=10000, cancel_pct=50, num_threads=4):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=500,
+        help="orders placed before cancelling (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="use the full 10,000-order run"
+    )
+    args = parser.parse_args()
+
     print("\n")
-    test_parallel_cancellations(num_orders=10000, cancel_pct=50, num_threads=4)
+    test_parallel_cancellations(
+        num_orders=10000 if args.full else args.size, cancel_pct=50, num_threads=4
+    )
     print("\n")
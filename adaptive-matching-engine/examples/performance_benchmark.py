@@ -1,26 +1,65 @@
+import io
 import time
-import statistics
 import json
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import islice
+from typing import Dict, Tuple
 import sys
 import os
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 from src.core.matching_engine import BaseMatchingEngine
 from src.core.matching_engine import AdaptiveMatchingEngine
 from src.data.order_generator import OrderGenerator
-from config import default_config
+from src.utils.performance import warm_up_engine
+from config.default_config import get_config
+
+# Orders timed together per clock sample in _benchmark_engine
+LATENCY_BLOCK_SIZE = 64
+
+# Reported latency percentiles, plus the maximum as the last key. Samples
+# are LATENCY_BLOCK_SIZE-order blocks (a few hundred per run), too few for a
+# P99.9 distinct from the maximum
+TAIL_QUANTILES = (0.5, 0.95, 0.99)
+TAIL_LATENCY_KEYS = (
+    "p50_latency_ms",
+    "p95_latency_ms",
+    "p99_latency_ms",
+    "max_latency_ms",
+)
 
 
 class OptimizedBenchmarkRunner:
     """Performance benchmark with optimized engines"""
 
+    # Regime detection settings from the project config, loaded once and shared
+    # by every runner (engines merge it into their own config dict)
+    _cfg = dict(get_config()["regime_detection"])
+
     def __init__(self):
         self.static_engine = BaseMatchingEngine()
-        self.optimized_adaptive_engine = AdaptiveMatchingEngine(config=default_config())
+        self.optimized_adaptive_engine = AdaptiveMatchingEngine(config=self._cfg)
         self.generator = OrderGenerator()
         self.results = {}
+        self._warm_up()
+
+    def _warm_up(self):
+        """
+        Pay first-call costs once, before the first benchmark phase.
+
+        Each engine processes a throwaway stream and is then reset, so the
+        measured runs start from an empty book.
+        """
+        for engine in (self.static_engine, self.optimized_adaptive_engine):
+            warm_up_engine(engine)
 
     def run_comparison_benchmark(self, order_count: int = 10000) -> Dict:
         """
@@ -30,23 +69,31 @@ class OptimizedBenchmarkRunner:
         print(f"PERFORMANCE BENCHMARK: {order_count:,} orders")
         print(f"{'='*70}\n")
 
-        orders = self.generator.generate_orders(order_count)
+        # Draw the whole stream in one vectorized pass; each engine gets its
+        # own Order objects built from the same columns (orders are mutated
+        # while matching)
+        batch = self.generator.generate_orders_soa(order_count)
 
         # Benchmark 1: Static Engine (baseline)
         print("🔵 Testing STATIC engine (baseline)...")
-        static_stats = self._benchmark_engine(self.static_engine, orders, "Static")
+        static_stats = self._benchmark_engine(
+            self.static_engine, OrderGenerator.orders_from_soa(batch), "Static"
+        )
 
         # Benchmark 2: Optimized Adaptive Engine
         print("\n🟢 Testing OPTIMIZED ADAPTIVE engine...")
         adaptive_stats = self._benchmark_engine(
-            self.optimized_adaptive_engine, orders, "Optimized Adaptive"
+            self.optimized_adaptive_engine,
+            OrderGenerator.orders_from_soa(batch),
+            "Optimized Adaptive",
         )
 
         # Calculate improvement
         speedup = static_stats["throughput_ops"] / adaptive_stats["throughput_ops"]
+        # Overhead is judged on the tail, not the mean
         latency_overhead = (
-            (adaptive_stats["avg_latency_ms"] - static_stats["avg_latency_ms"])
-            / static_stats["avg_latency_ms"]
+            (adaptive_stats["p99_latency_ms"] - static_stats["p99_latency_ms"])
+            / static_stats["p99_latency_ms"]
             * 100
         )
 
@@ -58,18 +105,13 @@ class OptimizedBenchmarkRunner:
         print(f"  Adaptive:  {adaptive_stats['throughput_ops']:,.0f} ops/sec")
         print(f"  Slowdown:  {speedup:.2f}x")
 
-        print(f"\nLatency:")
-        print(f"  Static:    {static_stats['avg_latency_ms']:.6f} ms (avg)")
-        print(f"  Adaptive:  {adaptive_stats['avg_latency_ms']:.6f} ms (avg)")
-        print(f"  Overhead:  {latency_overhead:+.1f}%")
-
-        print(f"\nP95 Latency:")
-        print(f"  Static:    {static_stats['p95_latency_ms']:.6f} ms")
-        print(f"  Adaptive:  {adaptive_stats['p95_latency_ms']:.6f} ms")
-
-        print(f"\nP99 Latency:")
-        print(f"  Static:    {static_stats['p99_latency_ms']:.6f} ms")
-        print(f"  Adaptive:  {adaptive_stats['p99_latency_ms']:.6f} ms")
+        print(f"\nLatency (ms):  {'P50':>10} {'P95':>10} {'P99':>10} {'Max':>10}")
+        for label, stats in (("Static", static_stats), ("Adaptive", adaptive_stats)):
+            print(
+                f"  {label + ':':<12}"
+                + "".join(f" {stats[key]:>10.6f}" for key in TAIL_LATENCY_KEYS)
+            )
+        print(f"  P99 Overhead: {latency_overhead:+.1f}%")
 
         # Adaptive-specific stats
         if hasattr(self.optimized_adaptive_engine, "regime_change_count"):
@@ -88,7 +130,7 @@ class OptimizedBenchmarkRunner:
             "optimized_adaptive": adaptive_stats,
             "comparison": {
                 "slowdown_factor": speedup,
-                "latency_overhead_pct": latency_overhead,
+                "p99_latency_overhead_pct": latency_overhead,
                 "target_achieved": speedup < 3.0,  # Target: <3x slower
             },
         }
@@ -97,44 +139,57 @@ class OptimizedBenchmarkRunner:
 
     def _benchmark_engine(self, engine, orders, name: str) -> Dict:
         """Benchmark a single engine"""
-        processing_times = []
-
-        # Warmup
+        # Warmup: consume the head of the stream through an iterator, so the
+        # measured tail is never copied out of the orders list
         warmup_count = min(100, len(orders) // 10)
-        for order in orders[:warmup_count]:
-            engine.process_order(order)
-
-        # Actual measurement
-        test_orders = orders[warmup_count:]
-        start_time = time.perf_counter()
-
-        for order in test_orders:
-            order_start = time.perf_counter()
-            engine.process_order(order)
-            processing_times.append(time.perf_counter() - order_start)
-
-        total_time = time.perf_counter() - start_time
-
-        # Calculate statistics
-        throughput = len(test_orders) / total_time
-        avg_latency = statistics.mean(processing_times) * 1000  # ms
-        p95_latency = (
-            statistics.quantiles(processing_times, n=20)[18] * 1000
-        )  # 95th percentile
-        p99_latency = (
-            statistics.quantiles(processing_times, n=100)[98] * 1000
-        )  # 99th percentile
-
-        print(f"  ✓ Processed {len(test_orders):,} orders in {total_time:.3f}s")
+        remaining = iter(orders)
+        engine.process_orders(islice(remaining, warmup_count))
+        test_count = len(orders) - warmup_count
+
+        # Actual measurement: time blocks of LATENCY_BLOCK_SIZE orders rather
+        # than every order, so the clock calls don't dominate sub-microsecond
+        # latencies. Each slot holds one block's elapsed time in integer ns.
+        block = LATENCY_BLOCK_SIZE
+        num_blocks = -(-test_count // block)
+        block_ns = np.empty(num_blocks, dtype=np.int64)
+        block_sizes = np.full(num_blocks, block, dtype=np.int64)
+        if num_blocks:
+            block_sizes[-1] = test_count - block * (num_blocks - 1)
+
+        # Bind the hot callables once so the loop body is local lookups only
+        process_orders = engine.process_orders
+        clock = time.perf_counter_ns
+
+        start_ns = clock()
+
+        for i, size in enumerate(block_sizes.tolist()):
+            block_start = clock()
+            process_orders(islice(remaining, size))
+            block_ns[i] = clock() - block_start
+
+        total_time = (clock() - start_ns) * 1e-9
+
+        # Calculate statistics (ns -> per-order seconds only when reporting)
+        block_latencies = block_ns / block_sizes * 1e-9
+        throughput = test_count / total_time
+        # Report the distribution rather than the mean (the mean is just
+        # 1 / throughput). Selection instead of a full sort: np.partition
+        # places the k-th smallest block at index k in O(n), and all
+        # percentiles come from one pass, scaled to ms together. Tails are
+        # over per-block means, so they understate single-order outliers.
+        n = len(block_latencies)
+        ranks = [min(int(q * n), n - 1) for q in TAIL_QUANTILES]
+        tails = (np.partition(block_latencies, ranks)[ranks] * 1000).tolist()
+        tails.append(float(block_latencies.max()) * 1000)
+
+        print(f"  ✓ Processed {test_count:,} orders in {total_time:.3f}s")
         print(f"  ✓ Throughput: {throughput:,.0f} ops/sec")
-        print(f"  ✓ Avg Latency: {avg_latency:.6f} ms")
+        print(f"  ✓ P99 / Max Latency: {tails[2]:.6f} / {tails[3]:.6f} ms")
 
         return {
             "throughput_ops": throughput,
-            "avg_latency_ms": avg_latency,
-            "p95_latency_ms": p95_latency,
-            "p99_latency_ms": p99_latency,
-            "total_orders": len(test_orders),
+            **dict(zip(TAIL_LATENCY_KEYS, tails)),
+            "total_orders": test_count,
             "total_time_sec": total_time,
         }
 
@@ -149,8 +204,8 @@ class OptimizedBenchmarkRunner:
         print("🔴 Testing with VOLATILE market conditions...")
         print("This tests adaptive behavior under stress\n")
 
-        # Reset engine
-        self.optimized_adaptive_engine = AdaptiveMatchingEngine(config=default_config())
+        # Reset engine (in place, so it stays warm)
+        self.optimized_adaptive_engine.reset()
 
         stats = self._benchmark_engine(
             self.optimized_adaptive_engine, volatile_orders, "Volatile Adaptive"
@@ -170,43 +225,79 @@ class OptimizedBenchmarkRunner:
             print("No results to save")
             return
 
+        write_results(self.results, filename)
+
+
+def write_results(results: Dict, filename: str):
+    """Write a results dict as indented JSON"""
+    if orjson is not None:
+        with open(filename, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    results,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2,
+                )
+            )
+    else:
         with open(filename, "w") as f:
-            json.dump(self.results, f, indent=2)
+            json.dump(results, f, indent=2)
 
-        print(f"✅ Results saved to {filename}")
+    print(f"✅ Results saved to {filename}")
 
 
-def main():
-    """Run optimized performance benchmarks"""
-    benchmark = OptimizedBenchmarkRunner()
+def run_benchmark_job(method: str, order_count: int) -> Tuple[str, Dict]:
+    """
+    Run one benchmark on a fresh runner (in a worker process).
 
-    # Test 1: Standard comparison
-    print("\n" + "=" * 70)
-    print("TEST 1: STANDARD PERFORMANCE COMPARISON")
-    print("=" * 70)
-    benchmark.run_comparison_benchmark(order_count=10000)
+    Returns the captured console output and the runner's comparison results,
+    so the parent can print reports in a fixed order.
+    """
+    runner = OptimizedBenchmarkRunner()
+    with redirect_stdout(io.StringIO()) as output:
+        getattr(runner, method)(order_count=order_count)
+    return output.getvalue(), runner.results
 
-    # Test 2: Volatile market
-    print("\n" + "=" * 70)
-    print("TEST 2: VOLATILE MARKET PERFORMANCE")
-    print("=" * 70)
-    benchmark.run_volatile_market_test(order_count=5000)
 
-    # Test 3: High load
-    print("\n" + "=" * 70)
-    print("TEST 3: HIGH LOAD STRESS TEST")
-    print("=" * 70)
-    benchmark.run_comparison_benchmark(order_count=50000)
+# (title, runner method, order count); each runs in its own process
+BENCHMARK_JOBS = [
+    ("TEST 1: STANDARD PERFORMANCE COMPARISON", "run_comparison_benchmark", 10000),
+    ("TEST 2: VOLATILE MARKET PERFORMANCE", "run_volatile_market_test", 5000),
+    ("TEST 3: HIGH LOAD STRESS TEST", "run_comparison_benchmark", 50000),
+]
+
+
+def main():
+    """Run optimized performance benchmarks"""
+    # The benchmarks use independent engines, so they run concurrently in
+    # separate processes; wall time is that of the longest one. Each process
+    # needs its own core for the numbers to stay comparable with serial runs.
+    with ProcessPoolExecutor(max_workers=len(BENCHMARK_JOBS)) as pool:
+        futures = [
+            pool.submit(run_benchmark_job, method, order_count)
+            for _, method, order_count in BENCHMARK_JOBS
+        ]
+
+        results = {}
+        for (title, _, _), future in zip(BENCHMARK_JOBS, futures):
+            output, job_results = future.result()
+            print("\n" + "=" * 70)
+            print(title)
+            print("=" * 70)
+            print(output, end="")
+            # The summary reports the last comparison run (the stress test)
+            results = job_results or results
 
     # Save results
-    benchmark.save_results()
+    if results:
+        write_results(results, "optimized_benchmark_results.json")
+    else:
+        print("No results to save")
 
     # Summary
     print("\n" + "=" * 70)
     print("🎯 OPTIMIZATION SUMMARY")
     print("=" * 70)
 
-    results = benchmark.results
     if results:
         comparison = results["comparison"]
 
@@ -11,6 +11,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.matching_engine import AdaptiveMatchingEngine
 from src.core.sharded_matching_engine import ShardedAdaptiveMatchingEngine
+from src.core.sharded_order_book import ShardedAdaptiveOrderBookSide
+from src.core.order_types import OrderSide, OrderType
 from src.data.order_generator import OrderGenerator
 
 
@@ -24,15 +26,14 @@ def quick_test(num_orders=10000, num_shards=8):
     print(f"  Shards: {num_shards}")
     print()
 
-    # Generate orders TWICE to ensure fair comparison
-    print("Generating orders for standard engine...")
+    # Draw the stream once and build a separate copy of the Order objects for
+    # each engine, so both see identical orders (they are mutated while matching)
+    print("Generating orders...")
     generator = OrderGenerator()
-    orders_standard = generator.generate_orders(count=num_orders)
-    print(f"Generated {len(orders_standard)} orders")
-
-    print("Generating orders for sharded engine...")
-    orders_sharded = generator.generate_orders(count=num_orders)
-    print(f"Generated {len(orders_sharded)} orders\n")
+    batch = generator.generate_orders_soa(num_orders)
+    orders_standard = OrderGenerator.orders_from_soa(batch)
+    orders_sharded = OrderGenerator.orders_from_soa(batch)
+    print(f"Generated {len(orders_standard)} orders per engine\n")
 
     # Test Standard Adaptive Engine
     print("-" * 80)
@@ -41,8 +42,7 @@ def quick_test(num_orders=10000, num_shards=8):
     standard_engine = AdaptiveMatchingEngine()
 
     start_time = time.perf_counter()
-    for order in orders_standard:
-        standard_engine.process_order(order)
+    standard_engine.process_orders(orders_standard)
     standard_elapsed = time.perf_counter() - start_time
 
     standard_throughput = num_orders / standard_elapsed
@@ -60,8 +60,7 @@ def quick_test(num_orders=10000, num_shards=8):
     sharded_engine = ShardedAdaptiveMatchingEngine(num_shards=num_shards)
 
     start_time = time.perf_counter()
-    for order in orders_sharded:
-        sharded_engine.process_order(order)
+    sharded_engine.process_orders(orders_sharded)
     sharded_elapsed = time.perf_counter() - start_time
 
     sharded_stats = sharded_engine.get_statistics()
@@ -92,6 +91,8 @@ def quick_test(num_orders=10000, num_shards=8):
         degradation = (1 - speedup) * 100
         print(f"Degradation:        {degradation:>12.1f}%")
 
+    bulk_load_test(batch, num_shards)
+
     print("\n" + "=" * 80)
     print("Sharded Order Book Distribution:")
     print("=" * 80)
@@ -107,6 +108,50 @@ def quick_test(num_orders=10000, num_shards=8):
             print(f"  Shard {shard_id}: {count:>8} orders")
 
 
+def bulk_load_test(batch, num_shards):
+    """
+    Compare serial vs shard-parallel loading of a resting (non-crossing) book.
+
+    Matching needs the global best price, so incoming orders stay serial;
+    only seeding resting liquidity can be split into per-shard batches.
+    """
+    print("\n" + "=" * 80)
+    print("Resting Book Bulk Load (per-shard batches)")
+    print("=" * 80)
+
+    limit_orders = [
+        o
+        for o in OrderGenerator.orders_from_soa(batch)
+        if o.order_type == OrderType.LIMIT
+    ]
+    mid = sorted(o.price for o in limit_orders)[len(limit_orders) // 2]
+    resting = {
+        OrderSide.BUY: [
+            o for o in limit_orders if o.side == OrderSide.BUY and o.price < mid
+        ],
+        OrderSide.SELL: [
+            o for o in limit_orders if o.side == OrderSide.SELL and o.price >= mid
+        ],
+    }
+    total = sum(len(orders) for orders in resting.values())
+
+    start_time = time.perf_counter()
+    for side, orders in resting.items():
+        add_order = ShardedAdaptiveOrderBookSide(side, num_shards=num_shards).add_order
+        for order in orders:
+            add_order(order)
+    serial_elapsed = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for side, orders in resting.items():
+        ShardedAdaptiveOrderBookSide(side, num_shards=num_shards).add_orders(orders)
+    parallel_elapsed = time.perf_counter() - start_time
+
+    print(f"\nResting orders:     {total:>12,}")
+    print(f"Serial add_order:   {total / serial_elapsed:>12,.0f} orders/sec")
+    print(f"Per-shard batches:  {total / parallel_elapsed:>12,.0f} orders/sec")
+
+
 if __name__ == "__main__":
     print("\n")
     quick_test(num_orders=10000, num_shards=8)
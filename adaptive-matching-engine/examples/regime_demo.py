@@ -6,6 +6,7 @@ Demonstration of regime detection and adaptive behavior
 import time
 import sys
 import os
+import numpy as np
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
@@ -30,53 +31,64 @@ class RegimeDemonstration:
 
         orders = self.generator.generate_orders(100, market_order_ratio=0.1)
 
+        # Record progress samples in the loop; format and print them after
+        progress = []
         for i, order in enumerate(orders):
             trades = self.engine.process_order(order)
 
             if i % 20 == 0:
                 snapshot = self.engine.get_order_book_snapshot()
-                print(
-                    f"Order {i}: Regime={self.engine.current_regime.value}, "
-                    f"Spread={snapshot.spread:.4f}, "
-                    f"Trades={len(trades)}"
+                progress.append(
+                    (i, self.engine.current_regime.value, snapshot.spread, len(trades))
                 )
 
+        for i, regime, spread, trade_count in progress:
+            print(
+                f"Order {i}: Regime={regime}, Spread={spread:.4f}, Trades={trade_count}"
+            )
+
     def demonstrate_volatile_regime(self):
         """Demonstrate high volatility regime"""
         print("\n=== HIGH VOLATILITY REGIME DEMONSTRATION ===")
         print("Characteristics: Large price movements, high cancellation rate")
 
-        # Create volatile conditions with large market orders
-        volatile_orders = []
-
-        # Add some large market orders to create volatility
-        for i in range(10):
-            large_order = self.generator.generate_orders(1, market_order_ratio=1.0)[0]
-            large_order.quantity = 500  # Make it large
-            volatile_orders.append(large_order)
+        # Create volatile conditions: 10 large market orders followed by
+        # normal orders with high price variation, drawn in one batch
+        volatile_orders = self.generator.generate_volatile_orders(
+            60, num_large=10, large_quantity=500
+        )
 
-        # Add normal orders with high price variation
-        volatile_orders.extend(self.generator.generate_volatile_orders(50))
-
-        regime_changed = False
+        # Record progress samples in the loop; format and print them after
+        progress = []
+        change_at = None
         for i, order in enumerate(volatile_orders):
             trades = self.engine.process_order(order)
 
             if (
-                not regime_changed
+                change_at is None
                 and self.engine.current_regime == MarketRegime.HIGH_VOLATILITY
             ):
-                print(f"*** REGIME CHANGE DETECTED at order {i} ***")
-                regime_changed = True
+                change_at = i
 
             if i % 10 == 0:
                 snapshot = self.engine.get_order_book_snapshot()
-                print(
-                    f"Order {i}: Regime={self.engine.current_regime.value}, "
-                    f"Spread={snapshot.spread:.4f}, "
-                    f"Large trades={len([t for t in trades if t.quantity > 100])}"
+                progress.append(
+                    (
+                        i,
+                        self.engine.current_regime.value,
+                        snapshot.spread,
+                        sum(1 for t in trades if t.quantity > 100),
+                    )
                 )
 
+        if change_at is not None:
+            print(f"*** REGIME CHANGE DETECTED at order {change_at} ***")
+        for i, regime, spread, large_trades in progress:
+            print(
+                f"Order {i}: Regime={regime}, Spread={spread:.4f}, "
+                f"Large trades={large_trades}"
+            )
+
     def demonstrate_illiquid_regime(self):
         """Demonstrate illiquid market regime"""
         print("\n=== ILLIQUID REGIME DEMONSTRATION ===")
@@ -85,14 +97,11 @@ class RegimeDemonstration:
         # Create illiquid conditions by processing few orders
         # and then checking the wide spreads
 
-        # First, clear the order book
-        self.engine = AdaptiveMatchingEngine()  # Reset
+        # First, clear the order book (in place, reusing the engine)
+        self.engine.reset()
 
         # Add only a few orders with wide spreads
-        illiquid_orders = [
-            self.generator.generate_orders(1, market_order_ratio=0.0)[0],
-            self.generator.generate_orders(1, market_order_ratio=0.0)[0],
-        ]
+        illiquid_orders = self.generator.generate_orders(2, market_order_ratio=0.0)
 
         # Set wide spreads manually (in INR)
         illiquid_orders[0].side = OrderSide.BUY
@@ -150,26 +159,26 @@ class RegimeDemonstration:
             print("No metrics history available")
             return
 
-        # Analyze metrics by regime
-        regime_metrics = {}
-        for metrics in self.engine.metrics_history:
-            regime = metrics["regime"]
-            if regime not in regime_metrics:
-                regime_metrics[regime] = []
-            regime_metrics[regime].append(metrics)
+        # Analyze metrics by regime: pull the columns out once, then aggregate
+        # per regime with bincount instead of grouping rows into lists
+        history = self.engine.metrics_history
+        regimes, codes = np.unique([m["regime"] for m in history], return_inverse=True)
+        spreads = np.fromiter((m["spread"] for m in history), float, len(history))
+        trades = np.fromiter(
+            (m["trades_generated"] for m in history), float, len(history)
+        )
+
+        samples = np.bincount(codes, minlength=len(regimes))
+        avg_spreads = np.bincount(codes, weights=spreads) / samples
+        avg_trades = np.bincount(codes, weights=trades) / samples
 
         print(f"{'Regime':<15} {'Samples':<10} {'Avg Spread':<12} {'Avg Trades':<12}")
         print("-" * 50)
 
-        for regime, metrics_list in regime_metrics.items():
-            avg_spread = sum(m["spread"] for m in metrics_list) / len(metrics_list)
-            avg_trades = sum(m["trades_generated"] for m in metrics_list) / len(
-                metrics_list
-            )
-
-            print(
-                f"{regime:<15} {len(metrics_list):<10} {avg_spread:<12.4f} {avg_trades:<12.2f}"
-            )
+        for regime, count, avg_spread, avg_trade in zip(
+            regimes.tolist(), samples.tolist(), avg_spreads, avg_trades
+        ):
+            print(f"{regime:<15} {count:<10} {avg_spread:<12.4f} {avg_trade:<12.2f}")
 
         print(f"\nTotal regime changes: {self.engine.regime_change_count}")
 
@@ -11,9 +11,11 @@ Tests focus on scenarios with heavy cancellation load.
 
 import sys
 import os
+import gc
 import time
-import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -22,6 +24,7 @@ from src.core.matching_engine import AdaptiveMatchingEngine
 from src.core.sharded_matching_engine import ShardedAdaptiveMatchingEngine
 from src.data.order_generator import OrderGenerator
 from src.core.order_types import OrderSide, OrderType
+from src.utils.performance import warm_up_engine
 
 
 def print_header(title):
@@ -31,6 +34,40 @@ def print_header(title):
     print("=" * 80)
 
 
+# GIL switch interval while worker threads cancel (CPython default is 5ms)
+THREAD_SWITCH_INTERVAL = 0.01
+
+
+@contextmanager
+def gc_paused():
+    """Collect up front, then keep the cyclic GC out of the timed region."""
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+# Seed for the cancellation draw, so every engine cancels the same orders
+CANCEL_SEED = 0
+
+
+def select_cancellations(orders, cancellation_rate, seed=CANCEL_SEED):
+    """
+    Pick ids of still-resting orders to cancel.
+
+    The whole cancellation mask is drawn in one vectorized call; only the
+    marked orders are then checked for remaining quantity.
+    """
+    marked = np.random.default_rng(seed).random(len(orders)) < cancellation_rate
+    return [
+        orders[i].order_id
+        for i in np.flatnonzero(marked).tolist()
+        if orders[i].remaining_quantity > 0
+    ]
+
+
 def benchmark_engine(engine, orders, cancellation_rate=0.3):
     """
     Benchmark an engine with orders and cancellations.
@@ -43,30 +80,21 @@ def benchmark_engine(engine, orders, cancellation_rate=0.3):
     Returns:
         Dict with performance metrics
     """
-    order_ids_to_cancel = []
-
-    # Phase 1: Add orders
-    start_time = time.perf_counter()
-
-    for i, order in enumerate(orders):
-        trades = engine.process_order(order)
-
-        # Mark some orders for cancellation
-        if random.random() < cancellation_rate and order.remaining_quantity > 0:
-            order_ids_to_cancel.append(order.order_id)
-
-    add_time = time.perf_counter() - start_time
-
-    # Phase 2: Cancel orders
-    cancel_start = time.perf_counter()
-    cancellations_succeeded = 0
-
-    for order_id in order_ids_to_cancel:
-        if engine.cancel_order(order_id):
-            cancellations_succeeded += 1
-
-    cancel_time = time.perf_counter() - cancel_start
-    total_time = time.perf_counter() - start_time
+    # Phase 1: Add orders (one batch submission)
+    with gc_paused():
+        start_time = time.perf_counter()
+        engine.process_orders(orders)
+        add_time = time.perf_counter() - start_time
+
+    # Mark some still-resting orders for cancellation (outside the timed phases)
+    order_ids_to_cancel = select_cancellations(orders, cancellation_rate)
+
+    # Phase 2: Cancel orders (one batch submission)
+    with gc_paused():
+        cancel_start = time.perf_counter()
+        cancellations_succeeded = engine.cancel_orders(order_ids_to_cancel)
+        cancel_time = time.perf_counter() - cancel_start
+    total_time = add_time + cancel_time
 
     # Get statistics
     if hasattr(engine, "get_statistics"):
@@ -104,43 +132,46 @@ def benchmark_parallel_cancellations(
     Returns:
         Dict with performance metrics
     """
-    order_ids_to_cancel = []
-
-    # Phase 1: Add orders (sequential for now)
-    start_time = time.perf_counter()
-
-    for order in orders:
-        trades = engine.process_order(order)
-        if random.random() < cancellation_rate and order.remaining_quantity > 0:
-            order_ids_to_cancel.append(order.order_id)
-
-    add_time = time.perf_counter() - start_time
-
-    # Phase 2: Parallel cancellations
-    cancel_start = time.perf_counter()
-
-    # Split cancellations across threads
-    def cancel_batch(order_ids):
-        count = 0
-        for order_id in order_ids:
-            if engine.cancel_order(order_id):
-                count += 1
-        return count
+    # Phase 1: Add orders (one batch submission)
+    with gc_paused():
+        start_time = time.perf_counter()
+        engine.process_orders(orders)
+        add_time = time.perf_counter() - start_time
+
+    # Mark some still-resting orders for cancellation (outside the timed phases)
+    order_ids_to_cancel = select_cancellations(orders, cancellation_rate)
+
+    # Bucket cancellations by shard so each task touches a single shard and
+    # concurrent tasks never contend for the same shard lock
+    shard_of = engine.shard_of
+    shard_buckets = [[] for _ in range(engine.num_shards)]
+    for order_id in order_ids_to_cancel:
+        shard_buckets[shard_of(order_id)].append(order_id)
 
-    batch_size = len(order_ids_to_cancel) // num_threads
+    # Exactly one batch per worker: worker w owns shards w, w + num_threads, ...
+    # The engine is pure Python, so the workers still share the GIL; each one
+    # submits its whole batch through cancel_orders.
     batches = [
-        order_ids_to_cancel[i : i + batch_size]
-        for i in range(0, len(order_ids_to_cancel), batch_size)
+        [order_id for bucket in shard_buckets[w::num_threads] for order_id in bucket]
+        for w in range(num_threads)
     ]
 
-    cancellations_succeeded = 0
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        futures = [executor.submit(cancel_batch, batch) for batch in batches]
-        for future in as_completed(futures):
-            cancellations_succeeded += future.result()
-
-    cancel_time = time.perf_counter() - cancel_start
-    total_time = time.perf_counter() - start_time
+    # Phase 2: Parallel cancellations. Each worker returns its own count and
+    # the counts are summed in submission order, so no per-future wake-ups.
+    # A longer switch interval means fewer forced GIL hand-offs between workers.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(THREAD_SWITCH_INTERVAL)
+    try:
+        with gc_paused():
+            cancel_start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                cancellations_succeeded = sum(
+                    executor.map(engine.cancel_orders, batches)
+                )
+            cancel_time = time.perf_counter() - cancel_start
+    finally:
+        sys.setswitchinterval(switch_interval)
+    total_time = add_time + cancel_time
 
     return {
         "total_time": total_time,
@@ -157,6 +188,38 @@ def benchmark_parallel_cancellations(
     }
 
 
+# Worker threads for the parallel-cancellation variant
+PARALLEL_CANCEL_THREADS = 4
+
+# (result key, label, engine factory taking the config, parallel cancellations)
+ENGINE_VARIANTS = [
+    (
+        "standard",
+        "Standard Adaptive Engine",
+        lambda config: AdaptiveMatchingEngine(config=config),
+        False,
+    ),
+    (
+        "sharded_8",
+        "Sharded Adaptive Engine (8 shards)",
+        lambda config: ShardedAdaptiveMatchingEngine(num_shards=8, config=config),
+        False,
+    ),
+    (
+        "sharded_16",
+        "Sharded Adaptive Engine (16 shards)",
+        lambda config: ShardedAdaptiveMatchingEngine(num_shards=16, config=config),
+        False,
+    ),
+    (
+        "sharded_parallel",
+        "Sharded (8 shards) with Parallel Cancellations",
+        lambda config: ShardedAdaptiveMatchingEngine(num_shards=8, config=config),
+        True,
+    ),
+]
+
+
 def run_benchmark_suite():
     """Run comprehensive benchmark suite."""
 
@@ -169,7 +232,7 @@ def run_benchmark_suite():
     cancellation_rates = [0.2, 0.5]  # 20% and 50% cancellations
     volatility = 0.02
 
-    generator = OrderGenerator(price_range=(18000.0, 19000.0))
+    generator = OrderGenerator(price_range=(18000.0, 19000.0), seed=42)
 
     results = []
 
@@ -180,77 +243,44 @@ def run_benchmark_suite():
                 f"Test: {order_count} orders, {cancel_rate*100:.0f}% cancellation rate"
             )
 
-            # Generate orders (same set for fair comparison)
-            orders = generator.generate_orders(order_count, volatility=volatility)
+            # Draw the order stream once; every engine gets its own Order
+            # objects built from the same columns (orders are mutated while
+            # matching), and the seeded cancellation draw picks the same orders
+            batch = generator.generate_orders_soa(order_count, volatility=volatility)
 
-            # Test 1: Standard Adaptive Engine
-            print("\n[1/4] Testing Standard Adaptive Engine...")
+            row = {"order_count": order_count, "cancel_rate": cancel_rate}
             config = {"detection_interval": 200}  # Less frequent for speed
-            engine1 = AdaptiveMatchingEngine(config=config)
-            result1 = benchmark_engine(
-                engine1, orders[:], cancellation_rate=cancel_rate
-            )
 
-            print(f"  Total Time: {result1['total_time']:.3f}s")
-            print(f"  Order Throughput: {result1['throughput']:,.0f} ops/s")
-            print(f"  Cancel Time: {result1['cancel_time']:.3f}s")
-            print(f"  Cancel Throughput: {result1['cancel_throughput']:,.0f} ops/s")
-
-            # Test 2: Sharded Adaptive Engine (8 shards)
-            print("\n[2/4] Testing Sharded Adaptive Engine (8 shards)...")
-            orders2 = generator.generate_orders(order_count, volatility=volatility)
-            engine2 = ShardedAdaptiveMatchingEngine(num_shards=8, config=config)
-            result2 = benchmark_engine(engine2, orders2, cancellation_rate=cancel_rate)
-
-            print(f"  Total Time: {result2['total_time']:.3f}s")
-            print(f"  Order Throughput: {result2['throughput']:,.0f} ops/s")
-            print(f"  Cancel Time: {result2['cancel_time']:.3f}s")
-            print(f"  Cancel Throughput: {result2['cancel_throughput']:,.0f} ops/s")
-            print(
-                f"  Speedup vs Standard: {result1['total_time']/result2['total_time']:.2f}x"
-            )
-
-            # Test 3: Sharded Adaptive Engine (16 shards)
-            print("\n[3/4] Testing Sharded Adaptive Engine (16 shards)...")
-            orders3 = generator.generate_orders(order_count, volatility=volatility)
-            engine3 = ShardedAdaptiveMatchingEngine(num_shards=16, config=config)
-            result3 = benchmark_engine(engine3, orders3, cancellation_rate=cancel_rate)
-
-            print(f"  Total Time: {result3['total_time']:.3f}s")
-            print(f"  Order Throughput: {result3['throughput']:,.0f} ops/s")
-            print(f"  Cancel Time: {result3['cancel_time']:.3f}s")
-            print(f"  Cancel Throughput: {result3['cancel_throughput']:,.0f} ops/s")
-            print(
-                f"  Speedup vs Standard: {result1['total_time']/result3['total_time']:.2f}x"
-            )
-
-            # Test 4: Sharded with Parallel Cancellations
-            print("\n[4/4] Testing Sharded (8 shards) with Parallel Cancellations...")
-            orders4 = generator.generate_orders(order_count, volatility=volatility)
-            engine4 = ShardedAdaptiveMatchingEngine(num_shards=8, config=config)
-            result4 = benchmark_parallel_cancellations(
-                engine4, orders4, cancellation_rate=cancel_rate, num_threads=4
-            )
-
-            print(f"  Total Time: {result4['total_time']:.3f}s")
-            print(f"  Order Throughput: {result4['throughput']:,.0f} ops/s")
-            print(f"  Cancel Time (4 threads): {result4['cancel_time']:.3f}s")
-            print(f"  Cancel Throughput: {result4['cancel_throughput']:,.0f} ops/s")
-            print(
-                f"  Speedup vs Standard: {result1['total_time']/result4['total_time']:.2f}x"
-            )
-
-            # Store results
-            results.append(
-                {
-                    "order_count": order_count,
-                    "cancel_rate": cancel_rate,
-                    "standard": result1,
-                    "sharded_8": result2,
-                    "sharded_16": result3,
-                    "sharded_parallel": result4,
-                }
-            )
+            for n, (key, label, make_engine, parallel) in enumerate(ENGINE_VARIANTS, 1):
+                print(f"\n[{n}/{len(ENGINE_VARIANTS)}] Testing {label}...")
+                engine = make_engine(config)
+                warm_up_engine(engine)
+                orders = OrderGenerator.orders_from_soa(batch)
+
+                if parallel:
+                    result = benchmark_parallel_cancellations(
+                        engine,
+                        orders,
+                        cancellation_rate=cancel_rate,
+                        num_threads=PARALLEL_CANCEL_THREADS,
+                    )
+                    cancel_label = f"Cancel Time ({PARALLEL_CANCEL_THREADS} threads)"
+                else:
+                    result = benchmark_engine(
+                        engine, orders, cancellation_rate=cancel_rate
+                    )
+                    cancel_label = "Cancel Time"
+                row[key] = result
+
+                print(f"  Total Time: {result['total_time']:.3f}s")
+                print(f"  Order Throughput: {result['throughput']:,.0f} ops/s")
+                print(f"  {cancel_label}: {result['cancel_time']:.3f}s")
+                print(f"  Cancel Throughput: {result['cancel_throughput']:,.0f} ops/s")
+                if key != "standard":
+                    speedup = row["standard"]["total_time"] / result["total_time"]
+                    print(f"  Speedup vs Standard: {speedup:.2f}x")
+
+            results.append(row)
 
     # Summary
     print_header("BENCHMARK SUMMARY")
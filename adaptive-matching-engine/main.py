@@ -207,14 +207,13 @@ def run_nifty_analysis(symbol="NIFTY", year=2020, sample_size=2000):
     # Test with both engines
     print("\n1. Testing STATIC engine...")
     static_engine = BaseMatchingEngine()
-    static_trades = 0
     import time
 
-    start = time.time()
-    for order in orders:
-        trades = static_engine.process_order(order)
-        static_trades += len(trades)
-    static_time = time.time() - start
+    # Each engine is timed over one process_orders call: the engine's own
+    # per-order loop, with trades counted from the slice it returns
+    start = time.perf_counter()
+    static_trades = len(static_engine.process_orders(orders))
+    static_time = time.perf_counter() - start
 
     print(f"   Time: {static_time:.2f}s")
     print(f"   Trades: {static_trades}")
@@ -222,12 +221,9 @@ def run_nifty_analysis(symbol="NIFTY", year=2020, sample_size=2000):
 
     print("\n2. Testing ADAPTIVE engine...")
     adaptive_engine = AdaptiveMatchingEngine()
-    adaptive_trades = 0
-    start = time.time()
-    for order in orders:
-        trades = adaptive_engine.process_order(order)
-        adaptive_trades += len(trades)
-    adaptive_time = time.time() - start
+    start = time.perf_counter()
+    adaptive_trades = len(adaptive_engine.process_orders(orders))
+    adaptive_time = time.perf_counter() - start
 
     print(f"   Time: {adaptive_time:.2f}s")
     print(f"   Trades: {adaptive_trades}")
@@ -3,18 +3,25 @@ Adaptive priority queue implementations for different market regimes
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Deque
-from collections import deque
+from typing import Dict, List, Optional
+from collections import OrderedDict
+from itertools import count
+import bisect
 import heapq
 
-from ..core.order_types import Order, MarketRegime
+from ..core.order_types import Order, OrderSide, MarketRegime
 
 
 class BasePriorityQueue(ABC):
-    """Abstract base class for priority queues"""
+    """
+    Abstract base class for priority queues
+
+    Orders are indexed by order_id in an OrderedDict, which keeps arrival
+    order and removes any order in O(1) instead of scanning a deque.
+    """
 
     def __init__(self):
-        self.orders = deque()
+        self.orders: "OrderedDict[str, Order]" = OrderedDict()
 
     @abstractmethod
     def push(self, order: Order):
@@ -33,14 +40,10 @@ class BasePriorityQueue(ABC):
 
     def remove(self, order: Order) -> bool:
         """Remove specific order from queue"""
-        try:
-            self.orders.remove(order)
-            return True
-        except ValueError:
-            return False
+        return self.orders.pop(order.order_id, None) is not None
 
     def is_empty(self) -> bool:
-        return len(self.orders) == 0
+        return len(self) == 0
 
     def __len__(self) -> int:
         return len(self.orders)
@@ -51,40 +54,159 @@ class PriceTimePriorityQueue(BasePriorityQueue):
 
     def push(self, order: Order):
         """Add order maintaining FIFO at same price level"""
-        self.orders.append(order)
+        self.orders[order.order_id] = order
+
+    def pop(self) -> Optional[Order]:
+        return self.orders.popitem(last=False)[1] if self.orders else None
+
+    def peek(self) -> Optional[Order]:
+        return next(iter(self.orders.values())) if self.orders else None
+
+
+def _size_time_key(order: Order):
+    """Size descending, then time ascending"""
+    return (-order.quantity, order.timestamp)
+
+
+def _directional_key(order: Order):
+    """Price-Time-Volume: size and time blended with different weights"""
+    return (-order.quantity * 0.7 - order.timestamp * 0.3, order.timestamp)
+
+
+# Heap key per regime; regimes without an entry keep plain FIFO order
+_REGIME_KEYS = {
+    MarketRegime.HIGH_VOLATILITY: _size_time_key,
+    MarketRegime.ILLIQUID: _size_time_key,
+    MarketRegime.DIRECTIONAL: _directional_key,
+}
+
+
+class _OrderHeap:
+    """
+    Binary heap of orders ordered by key(order), ties broken by arrival.
+
+    Entries are [key, seq, order]; the unique seq means orders themselves are
+    never compared. remove() only marks an entry, which is discarded once it
+    reaches the top; once marked entries outnumber live ones the heap is
+    rebuilt from the live entries, so it never holds more than twice the
+    live orders and every operation stays O(log n) amortized.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self._heap: List[list] = []
+        self._entries: Dict[str, list] = {}  # order_id -> live heap entry
+        self._removed = 0  # Marked entries still in the heap
+        self._seq = count()
+
+    def push(self, order: Order):
+        entry = [self.key(order), next(self._seq), order]
+        self._entries[order.order_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _discard_removed(self):
+        """Pop entries marked by remove() off the top of the heap"""
+        heap = self._heap
+        while heap and heap[0][-1] is None:
+            heapq.heappop(heap)
+            self._removed -= 1
 
     def pop(self) -> Optional[Order]:
-        return self.orders.popleft() if self.orders else None
+        self._discard_removed()
+        if not self._heap:
+            return None
+        order = heapq.heappop(self._heap)[-1]
+        del self._entries[order.order_id]
+        self._compact()
+        return order
 
     def peek(self) -> Optional[Order]:
-        return self.orders[0] if self.orders else None
+        self._discard_removed()
+        return self._heap[0][-1] if self._heap else None
+
+    def remove(self, order: Order) -> bool:
+        entry = self._entries.pop(order.order_id, None)
+        if entry is None:
+            return False
+        entry[-1] = None
+        self._removed += 1
+        self._compact()
+        return True
+
+    def _compact(self):
+        """Rebuild from the live entries once marked ones outnumber them"""
+        if self._removed > len(self._entries):
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+            self._removed = 0
+
+    def extend(self, orders):
+        """Add orders in sequence, keeping their relative order on ties"""
+        key = self.key
+        seq = self._seq
+        entries = [[key(order), next(seq), order] for order in orders]
+        self._entries.update((entry[-1].order_id, entry) for entry in entries)
+
+        # One O(n) heapify instead of a heappush per order
+        self._heap.extend(entries)
+        heapq.heapify(self._heap)
+
+    def drain(self) -> List[Order]:
+        """Remove and return every live order in priority order"""
+        orders = [entry[-1] for entry in sorted(self._entries.values())]
+        self._heap.clear()
+        self._entries.clear()
+        self._removed = 0
+        return orders
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class PriceSizeTimePriorityQueue(BasePriorityQueue):
-    """Price-Size-Time priority (largest orders first at same price)"""
+    """
+    Price-Size-Time priority (largest orders first at same price)
+
+    Backed by an _OrderHeap keyed on (-quantity, timestamp), so push and pop
+    are O(log n) instead of re-sorting the queue on every insert. The base
+    orders index is kept in step with the heap, in arrival order.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._heap = _OrderHeap(_size_time_key)
 
     def push(self, order: Order):
-        """Add order and maintain size-based sorting"""
-        self.orders.append(order)
-        # Sort by size descending, then time ascending
-        self.orders = deque(
-            sorted(self.orders, key=lambda o: (-o.quantity, o.timestamp))
-        )
+        self.orders[order.order_id] = order
+        self._heap.push(order)
 
     def pop(self) -> Optional[Order]:
-        return self.orders.popleft() if self.orders else None
+        order = self._heap.pop()
+        if order is not None:
+            del self.orders[order.order_id]
+        return order
 
     def peek(self) -> Optional[Order]:
-        return self.orders[0] if self.orders else None
+        return self._heap.peek()
+
+    def remove(self, order: Order) -> bool:
+        self.orders.pop(order.order_id, None)
+        return self._heap.remove(order)
 
 
-class HybridPriorityQueue(BasePriorityQueue):
+class HybridPriorityQueue(PriceTimePriorityQueue):
     """
     Hybrid priority queue that can switch between different priority schemes
+
+    FIFO regimes use the Price-Time queue; size-weighted regimes keep them
+    in an _OrderHeap, so a push never re-sorts the queue. The base orders
+    index holds every queued order in both modes. Switching regime carries
+    the current order over, as a stable re-sort would.
     """
 
     def __init__(self, initial_regime: MarketRegime = MarketRegime.NORMAL):
         super().__init__()
+        self._heap: Optional[_OrderHeap] = None
         self.regime = initial_regime
         self._update_ordering()
 
@@ -95,37 +217,47 @@ class HybridPriorityQueue(BasePriorityQueue):
             self._update_ordering()
 
     def _update_ordering(self):
-        """Reorder queue based on current regime"""
-        if self.regime == MarketRegime.NORMAL:
-            # Price-Time: FIFO (no sorting needed if maintained)
-            pass
-        elif self.regime in [MarketRegime.HIGH_VOLATILITY, MarketRegime.ILLIQUID]:
-            # Price-Size-Time: Sort by size (desc), then time (asc)
-            self.orders = deque(
-                sorted(self.orders, key=lambda o: (-o.quantity, o.timestamp))
-            )
-        elif self.regime == MarketRegime.DIRECTIONAL:
-            # Price-Time-Volume: Similar to PST but with different weights
-            self.orders = deque(
-                sorted(
-                    self.orders,
-                    key=lambda o: (-o.quantity * 0.7 - o.timestamp * 0.3, o.timestamp),
-                )
+        """Move the queued orders into the backend for the current regime"""
+        key = _REGIME_KEYS.get(self.regime)
+        if self._heap is not None:
+            if key is self._heap.key:
+                return
+            # Continue from the current priority order
+            self.orders = OrderedDict(
+                (order.order_id, order) for order in self._heap.drain()
             )
+
+        if key is None:
+            # Price-Time: FIFO from the current order onwards
+            self._heap = None
         else:
-            # Default to Price-Time
-            pass
+            self._heap = _OrderHeap(key)
+            self._heap.extend(self.orders.values())
 
     def push(self, order: Order):
-        """Add order and maintain regime-appropriate ordering"""
-        self.orders.append(order)
-        self._update_ordering()
+        """Add order in its regime-appropriate position"""
+        super().push(order)
+        if self._heap is not None:
+            self._heap.push(order)
 
     def pop(self) -> Optional[Order]:
-        return self.orders.popleft() if self.orders else None
+        if self._heap is None:
+            return super().pop()
+        order = self._heap.pop()
+        if order is not None:
+            del self.orders[order.order_id]
+        return order
 
     def peek(self) -> Optional[Order]:
-        return self.orders[0] if self.orders else None
+        if self._heap is None:
+            return super().peek()
+        return self._heap.peek()
+
+    def remove(self, order: Order) -> bool:
+        removed = super().remove(order)
+        if self._heap is not None:
+            self._heap.remove(order)
+        return removed
 
 
 class AdaptivePriorityManager:
@@ -135,13 +267,17 @@ class AdaptivePriorityManager:
 
     def __init__(self):
         self.queues = {}  # price -> HybridPriorityQueue
+        # Active prices kept sorted ascending, so the best price is an O(1) read
+        self._prices: List[float] = []
         self.current_regime = MarketRegime.NORMAL
 
     def get_queue(self, price: float) -> HybridPriorityQueue:
         """Get or create priority queue for price level"""
-        if price not in self.queues:
-            self.queues[price] = HybridPriorityQueue(self.current_regime)
-        return self.queues[price]
+        queue = self.queues.get(price)
+        if queue is None:
+            queue = self.queues[price] = HybridPriorityQueue(self.current_regime)
+            bisect.insort(self._prices, price)
+        return queue
 
     def set_regime(self, new_regime: MarketRegime):
         """Set new regime for all priority queues"""
@@ -165,6 +301,7 @@ class AdaptivePriorityManager:
             # Clean up empty queues
             if queue.is_empty():
                 del self.queues[order.price]
+                del self._prices[bisect.bisect_left(self._prices, order.price)]
 
             return removed
         return False
@@ -176,5 +313,11 @@ class AdaptivePriorityManager:
         return None
 
     def get_all_prices(self) -> List[float]:
-        """Get all prices with active orders"""
-        return list(self.queues.keys())
+        """Get all prices with active orders, in ascending order"""
+        return list(self._prices)
+
+    def get_best_price(self, side: OrderSide) -> Optional[float]:
+        """Highest active price for bids, lowest for asks"""
+        if not self._prices:
+            return None
+        return self._prices[-1] if side == OrderSide.BUY else self._prices[0]
@@ -5,6 +5,8 @@ Policy definitions for different market regimes
 from dataclasses import dataclass
 from typing import Callable, Dict, Any
 from enum import Enum
+from operator import attrgetter
+import numpy as np
 
 from ..core.order_types import MarketRegime, Order, OrderSide
 from .adaptive_priority import (
@@ -13,6 +15,10 @@ from .adaptive_priority import (
     PriceSizeTimePriorityQueue,
 )
 
+# Levels with fewer resting orders are ranked with sorted(); NumPy's lexsort
+# only pays for its column extraction on larger levels
+LEXSORT_MIN_ORDERS = 100
+
 
 class MatchingAlgorithm(Enum):
     FIFO = "FIFO"
@@ -155,9 +161,28 @@ class PolicyManager:
         # Simple FIFO - return orders in their current sequence
         return orders
 
+    @staticmethod
+    def _rank_by_size(orders: list, remaining: bool) -> list:
+        """Largest (remaining) size first, earlier timestamp on ties (stable)"""
+        if len(orders) < LEXSORT_MIN_ORDERS:
+            if remaining:
+                return sorted(
+                    orders, key=lambda o: (-o.remaining_quantity, o.timestamp)
+                )
+            return sorted(orders, key=lambda o: (-o.quantity, o.timestamp))
+
+        size = attrgetter("remaining_quantity" if remaining else "quantity")
+        quantities = np.fromiter(map(size, orders), dtype=np.int64, count=len(orders))
+        timestamps = np.fromiter(
+            (o.timestamp for o in orders), dtype=np.float64, count=len(orders)
+        )
+        # lexsort: last key is primary -> size desc, then time asc
+        ranking = np.lexsort((timestamps, -quantities))
+        return [orders[i] for i in ranking.tolist()]
+
     def _size_priority_matching(self, orders: list, incoming_order: Order) -> list:
         """Size-priority matching (largest orders first)"""
-        return sorted(orders, key=lambda o: (-o.quantity, o.timestamp))
+        return self._rank_by_size(orders, remaining=False)
 
     def _pro_rata_matching(self, orders: list, incoming_order: Order) -> list:
         """Pro-rata matching for large incoming orders"""
@@ -167,18 +192,11 @@ class PolicyManager:
             return self._fifo_matching(orders, incoming_order)
 
         # For large orders, use pro-rata allocation
-        total_volume = sum(order.remaining_quantity for order in orders)
-        if total_volume == 0:
+        if not any(order.remaining_quantity for order in orders):
             return orders
 
-        # Sort by allocation percentage (simplified)
-        weighted_orders = []
-        for order in orders:
-            allocation = order.remaining_quantity / total_volume
-            weighted_orders.append((allocation, order.timestamp, order))
-
-        weighted_orders.sort(key=lambda x: (-x[0], x[1]))  # Allocation desc, time asc
-        return [order for _, _, order in weighted_orders]
+        # Allocation share is proportional to remaining size: desc, time asc
+        return self._rank_by_size(orders, remaining=True)
 
     def should_encourage_liquidity(self) -> bool:
         """Check if current policy encourages liquidity provision"""
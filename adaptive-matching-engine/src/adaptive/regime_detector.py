@@ -1,10 +1,11 @@
+import math
 from collections import deque
 from dataclasses import dataclass
 from typing import Optional
-import numpy as np
-from ..core.order_types import MarketRegime, OrderSide
+from ..core.order_types import MarketRegime, OrderSide, _with_slots
 
 
+@_with_slots
 @dataclass
 class MarketMetrics:
     volatility: float = 0.0
@@ -31,6 +32,8 @@ class OptimizedRegimeDetector:
             "detection_interval", 100
         )  # Check every 100 orders
         self.order_count = 0
+        # order_count % detection_interval, computed once per update
+        self._interval_pos = 0
         self.last_regime = MarketRegime.NORMAL
 
         # Window size for calculations (default matches tests)
@@ -41,13 +44,16 @@ class OptimizedRegimeDetector:
         self.volume_history: deque = deque(maxlen=self.window_size)
         self.spread_history: deque = deque(maxlen=self.window_size)
 
-        # Cached metrics with dirty flag
-        self._cached_metrics: Optional[MarketMetrics] = None
+        # Cached metrics, updated in place: window statistics are recomputed
+        # when dirty, book-dependent fields when the call arguments change
+        self._cached_metrics = MarketMetrics()
         self._metrics_dirty = True
+        self._metrics_inputs: Optional[tuple] = None
 
-        # Running sums for incremental calculation
-        self._price_sum = 0.0
-        self._price_sq_sum = 0.0
+        # Running window statistics: Welford mean / sum of squared deviations
+        # for prices (stable at NIFTY-sized prices), plain sum for spreads
+        self._price_mean = 0.0
+        self._price_m2 = 0.0
         self._spread_sum = 0.0
 
         # Counters
@@ -88,22 +94,29 @@ class OptimizedRegimeDetector:
         else:
             self.sell_volume += volume
 
-        # Only update histories if near detection interval
-        if self.order_count % self.detection_interval < 10:  # Only last 10 orders
-            # Incremental updates for mean calculation
-            if len(self.price_history) == self.window_size:
+        # Only update histories for the 10 orders starting at each detection point
+        self._interval_pos = self.order_count % self.detection_interval
+        if self._interval_pos < 10:
+            # Incremental updates for mean and variance
+            n = len(self.price_history)
+            mean = self._price_mean
+            if n == self.window_size:
+                # Full window: the new price replaces the oldest one
                 old_price = self.price_history[0]
-                self._price_sum -= old_price
-                self._price_sq_sum -= old_price * old_price
-                old_spread = self.spread_history[0]
-                self._spread_sum -= old_spread
+                new_mean = mean + (current_price - old_price) / n
+                self._price_m2 += (current_price - old_price) * (
+                    current_price - new_mean + old_price - mean
+                )
+                self._spread_sum -= self.spread_history[0]
+            else:
+                new_mean = mean + (current_price - mean) / (n + 1)
+                self._price_m2 += (current_price - mean) * (current_price - new_mean)
+            self._price_mean = new_mean
 
             self.price_history.append(current_price)
             self.volume_history.append(volume)
             self.spread_history.append(spread)
 
-            self._price_sum += current_price
-            self._price_sq_sum += current_price * current_price
             self._spread_sum += spread
             self._metrics_dirty = True
 
@@ -117,7 +130,7 @@ class OptimizedRegimeDetector:
 
     def should_detect_regime(self) -> bool:
         """Check if we should run regime detection (performance gating)"""
-        return self.order_count % self.detection_interval == 0
+        return self._interval_pos == 0
 
     def detect_regime(
         self, bid_price: float, ask_price: float, buy_volume: int, sell_volume: int
@@ -170,17 +183,22 @@ class OptimizedRegimeDetector:
         """
         OPTIMIZED metrics calculation using cached values
         """
-        if not self._metrics_dirty and self._cached_metrics:
-            return self._cached_metrics
+        metrics = self._cached_metrics
+        inputs = (bid_price, ask_price, buy_volume, sell_volume)
+        if not self._metrics_dirty:
+            if inputs != self._metrics_inputs:
+                self._update_book_metrics(metrics, inputs)
+            return metrics
 
         # Fast volatility using incremental calculation
         n = len(self.price_history)
         if n < 2:
             volatility = 0.0
         else:
-            mean = self._price_sum / n
-            variance = (self._price_sq_sum / n) - (mean * mean)
-            volatility = np.sqrt(max(variance, 0)) / mean if mean > 0 else 0.0
+            mean = self._price_mean
+            # m2 can only dip below zero by rounding when all prices are equal
+            variance = max(self._price_m2, 0.0) / n
+            volatility = math.sqrt(variance) / mean if mean > 0 else 0.0
 
         # Fast spread calculation
         avg_spread = self._spread_sum / n if n > 0 else 0.0
@@ -193,10 +211,6 @@ class OptimizedRegimeDetector:
             else 0.0
         )
 
-        # Order book imbalance
-        ob_total = buy_volume + sell_volume
-        ob_imbalance = abs(buy_volume - sell_volume) / ob_total if ob_total > 0 else 0.0
-
         # Cancellation rate
         cancel_rate = (
             self.cancellation_count / self.total_orders
@@ -204,27 +218,35 @@ class OptimizedRegimeDetector:
             else 0.0
         )
 
-        mid_price = (
+        metrics.volatility = volatility
+        metrics.spread = avg_spread
+        metrics.volume_imbalance = volume_imbalance
+        metrics.cancellation_rate = cancel_rate
+        self._update_book_metrics(metrics, inputs)
+
+        self._metrics_dirty = False
+        return metrics
+
+    def _update_book_metrics(self, metrics: MarketMetrics, inputs: tuple):
+        """Refresh the fields that depend on the caller's book snapshot"""
+        bid_price, ask_price, buy_volume, sell_volume = inputs
+
+        # Order book imbalance
+        ob_total = buy_volume + sell_volume
+        metrics.order_book_imbalance = (
+            abs(buy_volume - sell_volume) / ob_total if ob_total > 0 else 0.0
+        )
+
+        metrics.mid_price = (
             (bid_price + ask_price) / 2
             if (bid_price is not None and ask_price is not None)
             else 0.0
         )
-
-        self._cached_metrics = MarketMetrics(
-            volatility=volatility,
-            spread=avg_spread,
-            volume_imbalance=volume_imbalance,
-            order_book_imbalance=ob_imbalance,
-            cancellation_rate=cancel_rate,
-            mid_price=mid_price,
-        )
-
-        self._metrics_dirty = False
-        return self._cached_metrics
+        self._metrics_inputs = inputs
 
     def get_metrics_summary(self) -> dict:
         """Get current metrics summary (cached when possible)"""
-        if not self._metrics_dirty and self._cached_metrics:
+        if not self._metrics_dirty:
             metrics = self._cached_metrics
         else:
             metrics = self._calculate_fast_metrics(0, 0, 0, 0)
@@ -5,22 +5,48 @@ Historical simulation engine for Nifty data
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple, Optional
+import io
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
+from itertools import islice
 import os
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
+
 from ..core.matching_engine import AdaptiveMatchingEngine, BaseMatchingEngine
 from ..core.order_types import Order, Trade, MarketRegime
 from ..utils.performance import PerformanceMonitor
 from ..data.nifty_loader import NiftyDataLoader
 
+# Per-10k-order progress lines inside the timed simulation loop are opt-in
+VERBOSE = os.environ.get("AME_VERBOSE") == "1"
 
-class HistoricalSimulator:
-    """Runs historical simulations with Nifty data"""
+# Orders handed to engine.process_orders per call (one progress line each)
+PROGRESS_INTERVAL = 10000
+
+# Per-engine result lists that are saved as counts rather than in full
+LARGE_RESULT_KEYS = ("trades", "regime_history", "metrics_history")
 
-    def __init__(self, results_dir: str = "results"):
-        self.adaptive_engine = AdaptiveMatchingEngine()
-        self.static_engine = BaseMatchingEngine()
+
+class HistoricalSimulator:
+    """
+    Runs historical simulations with Nifty data.
+
+    Every run_simulation call builds a fresh adaptive and static engine in
+    its own worker process (configured from adaptive_config), so the
+    simulator holds no engines; read engine statistics from the returned
+    results instead.
+    """
+
+    def __init__(
+        self, results_dir: str = "results", adaptive_config: Optional[Dict] = None
+    ):
+        self.adaptive_config = adaptive_config
         self.data_loader = NiftyDataLoader()
         self.results_dir = results_dir
         os.makedirs(results_dir, exist_ok=True)
@@ -45,10 +71,16 @@ class HistoricalSimulator:
 
         # Sample data if needed for performance
         if sample_fraction < 1.0:
-            sample_size = int(len(historical_data) * sample_fraction)
-            historical_data = historical_data.sample(
-                n=min(sample_size, len(historical_data))
+            sample_size = min(
+                int(len(historical_data) * sample_fraction), len(historical_data)
             )
+            # Pick rows at random but keep them in their original (time)
+            # order: convert_to_orders compares each record with the previous
+            # one
+            positions = np.sort(
+                np.random.choice(len(historical_data), size=sample_size, replace=False)
+            )
+            historical_data = historical_data.iloc[positions]
             print(
                 f"Using sample of {len(historical_data)} records ({sample_fraction*100}%)"
             )
@@ -60,18 +92,23 @@ class HistoricalSimulator:
             print("No orders generated from historical data")
             return {}
 
-        # Sort orders by timestamp
-        orders.sort(key=lambda x: x.timestamp)
-
         print(f"Processing {len(orders)} orders...")
 
-        # Run simulation on both engines
-        adaptive_results = self._run_engine_simulation(
-            self.adaptive_engine, orders, "adaptive"
-        )
-        static_results = self._run_engine_simulation(
-            self.static_engine, orders, "static"
-        )
+        # Run both engines concurrently, each in its own process on its own
+        # copy of the orders (engines fill Order objects in place, so they
+        # must not share them); reports are printed in a fixed order
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            adaptive_future = pool.submit(
+                run_engine_simulation_job,
+                "adaptive",
+                orders,
+                self.adaptive_config,
+            )
+            static_future = pool.submit(run_engine_simulation_job, "static", orders)
+
+            adaptive_output, adaptive_results = adaptive_future.result()
+            static_output, static_results = static_future.result()
+        print(adaptive_output + static_output, end="")
 
         # Analyze regime effectiveness
         regime_analysis = self._analyze_regime_effectiveness(historical_data)
@@ -96,27 +133,31 @@ class HistoricalSimulator:
 
         return self.simulation_results[results_key]
 
-    def _run_engine_simulation(
-        self, engine, orders: List[Order], engine_type: str
-    ) -> Dict:
+    @staticmethod
+    def _run_engine_simulation(engine, orders: List[Order], engine_type: str) -> Dict:
         """Run simulation on a single engine"""
         print(f"Running {engine_type} engine simulation...")
 
         monitor = PerformanceMonitor(engine)
         start_time = time.time()
 
-        # Process all orders
-        all_trades = []
-        for i, order in enumerate(orders):
-            trades = engine.process_order(order)
-            all_trades.extend(trades)
+        # Process all orders in batches; the per-order loop runs inside the
+        # engine and trades are sliced from its history once at the end
+        trades_before = len(engine.trade_history)
+        remaining = iter(orders)
+        processed = 0
+        while processed < len(orders):
+            batch_size = min(PROGRESS_INTERVAL, len(orders) - processed)
+            engine.process_orders(islice(remaining, batch_size))
+            processed += batch_size
 
             # Progress reporting
-            if (i + 1) % 10000 == 0:
+            if VERBOSE and processed % PROGRESS_INTERVAL == 0:
                 elapsed = time.time() - start_time
-                print(f"  Processed {i+1}/{len(orders)} orders ({elapsed:.2f}s)")
+                print(f"  Processed {processed}/{len(orders)} orders ({elapsed:.2f}s)")
 
         total_time = time.time() - start_time
+        all_trades = engine.trade_history[trades_before:]
 
         # Collect results
         results = {
@@ -201,23 +242,35 @@ class HistoricalSimulator:
 
     def _save_results(self, results_key: str):
         """Save simulation results to file"""
-        import json
-
         filename = os.path.join(self.results_dir, f"{results_key}_results.json")
 
-        # Convert to serializable format
+        # Convert to serializable format; the large lists live in the
+        # per-engine results, so summarize them one level down
         serializable_results = {}
         for key, result in self.simulation_results[results_key].items():
-            if key in ["trades", "regime_history", "metrics_history"]:
-                # Skip large data structures
-                serializable_results[key] = f"Count: {len(result)}"
-            elif key == "performance_report":
-                serializable_results[key] = result
-            else:
-                serializable_results[key] = result
-
-        with open(filename, "w") as f:
-            json.dump(serializable_results, f, indent=2, default=str)
+            if key in ("adaptive", "static"):
+                result = {
+                    name: (
+                        f"Count: {len(value)}" if name in LARGE_RESULT_KEYS else value
+                    )
+                    for name, value in result.items()
+                }
+            serializable_results[key] = result
+
+        if orjson is not None:
+            with open(filename, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        serializable_results,
+                        default=str,
+                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2,
+                    )
+                )
+        else:
+            import json
+
+            with open(filename, "w") as f:
+                json.dump(serializable_results, f, indent=2, default=str)
 
         print(f"Results saved to {filename}")
 
@@ -251,3 +304,25 @@ class HistoricalSimulator:
             print(
                 f"Adaptive Engine - Final Regime: {adaptive.get('final_regime', 'N/A')}"
             )
+
+
+def run_engine_simulation_job(
+    engine_type: str, orders: List[Order], config: Optional[Dict] = None
+) -> Tuple[str, Dict]:
+    """
+    Run one engine simulation on a fresh engine (in a worker process).
+
+    Engines hold locks and cannot be pickled, so the worker builds its own
+    from the engine type and config. Returns the captured console output and
+    the simulation results.
+    """
+    if engine_type == "adaptive":
+        engine = AdaptiveMatchingEngine(config=config)
+    else:
+        engine = BaseMatchingEngine()
+
+    with redirect_stdout(io.StringIO()) as output:
+        results = HistoricalSimulator._run_engine_simulation(
+            engine, orders, engine_type
+        )
+    return output.getvalue(), results
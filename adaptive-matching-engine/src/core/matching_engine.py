@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict, Tuple
 import time
+from collections import Counter
 from .order_book import OrderBookSide, AdaptiveOrderBookSide, PriceLevel
 from .order_types import Order, OrderSide, Trade, OrderType, MarketRegime
 from ..adaptive.regime_detector import OptimizedRegimeDetector
@@ -21,10 +22,32 @@ class BaseMatchingEngine:
         """
         return self.add_order(order)
 
+    def process_orders(self, orders: List[Order]) -> List[Trade]:
+        """
+        Process a batch of orders in sequence and return all generated trades
+
+        Dispatches through process_order, so subclasses keep their per-order
+        behaviour; the bound method is looked up once for the whole batch and
+        trades are sliced from trade_history instead of collected per call.
+        """
+        trades_before = len(self.trade_history)
+        process_order = self.process_order
+
+        for order in orders:
+            process_order(order)
+
+        return self.trade_history[trades_before:]
+
+    def reset(self):
+        """Clear the order book and order/trade history in place"""
+        self.bids.clear()
+        self.asks.clear()
+        self.trade_history.clear()
+        self.order_history.clear()
+
     def add_order(self, order: Order) -> List[Trade]:
         """Add order and return list of generated trades"""
         self.order_history.append(order)
-        trades = []
 
         if order.side == OrderSide.BUY:
             trades = self._match_buy_order(order)
@@ -162,6 +185,17 @@ class BaseMatchingEngine:
         # Order not found - might already be filled or cancelled
         return False
 
+    def cancel_orders(self, order_ids: List[str]) -> int:
+        """Cancel a batch of orders by ID and return how many were cancelled"""
+        cancel_order = self.cancel_order
+        cancelled = 0
+
+        for order_id in order_ids:
+            if cancel_order(order_id):
+                cancelled += 1
+
+        return cancelled
+
     def get_order_book_snapshot(self, levels: int = 10):
         """Get current order book snapshot"""
         from .order_types import OrderBookSnapshot
@@ -195,6 +229,7 @@ class AdaptiveMatchingEngine(BaseMatchingEngine):
 
         # Use optimized regime detector with configuration
         self.regime_detector = OptimizedRegimeDetector(self.config)
+        self._cache_intervals()
         self.current_regime = MarketRegime.NORMAL
         self.regime_change_count = 0
         self.last_regime_change = time.time()
@@ -202,6 +237,9 @@ class AdaptiveMatchingEngine(BaseMatchingEngine):
         # Statistics
         self.metrics_history = []
         self.regime_history = []
+        # Per-regime transition counts, kept alongside regime_history so
+        # statistics don't rescan the history
+        self._regime_counts = Counter()
 
         # Performance optimization
         self.order_count = 0
@@ -223,6 +261,11 @@ class AdaptiveMatchingEngine(BaseMatchingEngine):
             "enable_metrics_recording": True,
         }
 
+    def _cache_intervals(self):
+        """Resolve detection/recording intervals once instead of on every order"""
+        self._detection_interval = self.regime_detector.detection_interval
+        self._record_interval = max(1, self._detection_interval // 10)
+
     def process_order(self, order: Order) -> List[Trade]:
         """Process order with adaptive logic"""
         # If in benchmark mode, avoid extra metric/regime overhead
@@ -233,9 +276,7 @@ class AdaptiveMatchingEngine(BaseMatchingEngine):
         self.order_count += 1
 
         # FAST PATH - only update metrics and detect regime periodically
-        interval = getattr(self.regime_detector, "detection_interval", 100)
-
-        if self.order_count % interval == 0:
+        if self.order_count % self._detection_interval == 0:
             # Update market metrics with new order
             self._update_market_metrics(order)
 
@@ -263,8 +304,7 @@ class AdaptiveMatchingEngine(BaseMatchingEngine):
         trades = self.add_order(order)
 
         # Record metrics (only periodically to save time)
-        record_interval = max(1, interval // 10)
-        if self.order_count % record_interval == 0:
+        if self.order_count % self._record_interval == 0:
             self._record_metrics(order, trades)
 
         return trades
@@ -289,12 +329,14 @@ class AdaptiveMatchingEngine(BaseMatchingEngine):
                 "to_regime": new_regime.value,
             }
         )
+        self._regime_counts[new_regime.value] += 1
 
     def update_config(self, new_config: Dict):
         """Update engine configuration dynamically"""
         self.config.update(new_config)
         # Update regime detector with new config
         self.regime_detector = OptimizedRegimeDetector(self.config)
+        self._cache_intervals()
 
     def get_config(self) -> Dict:
         """Get current configuration"""
@@ -317,15 +359,10 @@ class AdaptiveMatchingEngine(BaseMatchingEngine):
 
     def get_regime_statistics(self) -> Dict:
         """Get comprehensive regime statistics"""
-        regime_counts = {}
-        for entry in self.regime_history:
-            regime = entry["to_regime"]
-            regime_counts[regime] = regime_counts.get(regime, 0) + 1
-
         return {
             "total_changes": self.regime_change_count,
             "current_regime": self.current_regime.value,
-            "regime_distribution": regime_counts,
+            "regime_distribution": dict(self._regime_counts),
             "regime_history": self.regime_history,
             "time_since_last_change": (
                 time.time() - self.last_regime_change if self.last_regime_change else 0
@@ -336,9 +373,20 @@ class AdaptiveMatchingEngine(BaseMatchingEngine):
         """Reset all statistics and history"""
         self.metrics_history.clear()
         self.regime_history.clear()
+        self._regime_counts.clear()
         self.regime_change_count = 0
         self.order_count = 0
 
+    def reset(self):
+        """Return to a freshly constructed state, keeping the configuration"""
+        super().reset()
+
+        self.regime_detector = OptimizedRegimeDetector(self.config)
+        self._cache_intervals()
+        self.current_regime = MarketRegime.NORMAL
+        self.last_regime_change = time.time()
+        self.reset_statistics()
+
     def _update_market_metrics(self, order: Order):
         """Update internal market metrics for regime detection"""
         self.regime_detector.update_metrics(
@@ -18,6 +18,7 @@ import time
 from collections import defaultdict
 import threading
 import queue
+import numpy as np
 from .order_book import OrderBookSide, PriceLevel
 from .order_types import Order, OrderSide, Trade, OrderType, OrderValidity, TradingPhase
 
@@ -189,6 +190,20 @@ class NSEMatchingEngine:
         else:
             return self._handle_continuous_order(order)
 
+    def process_orders(self, orders: List[Order]) -> List[Trade]:
+        """
+        Process a batch of orders in sequence and return all generated trades.
+        Each order still goes through process_order (phase, band and tick checks).
+        """
+        trades: List[Trade] = []
+        extend = trades.extend
+        process_order = self.process_order
+
+        for order in orders:
+            extend(process_order(order))
+
+        return trades
+
     def _handle_auction_order(self, order: Order) -> List[Trade]:
         """Handle orders during call auction phase."""
         # In auction, just accumulate orders (no matching yet)
@@ -262,42 +277,43 @@ class NSEMatchingEngine:
         Returns (price, volume) or (None, 0) if no overlap.
         """
         # Get all unique prices
-        all_prices = sorted(set(list(buy_orders.keys()) + list(sell_orders.keys())))
+        all_prices = sorted(set(buy_orders) | set(sell_orders))
 
         if not all_prices:
             return None, 0
 
-        best_price = None
-        max_volume = 0
+        # Total quantity resting at each candidate price, per side
+        prices = np.array(all_prices, dtype=np.float64)
+        buy_at = np.array(
+            [sum(o.quantity for o in buy_orders.get(p, ())) for p in all_prices],
+            dtype=np.int64,
+        )
+        sell_at = np.array(
+            [sum(o.quantity for o in sell_orders.get(p, ())) for p in all_prices],
+            dtype=np.int64,
+        )
 
-        for price in all_prices:
-            # Calculate buy volume at this price (all buys >= price)
-            buy_volume = sum(
-                sum(o.quantity for o in orders)
-                for p, orders in buy_orders.items()
-                if p >= price
-            )
+        # Buy volume at a price is every buy at or above it (suffix sum); sell
+        # volume is every sell at or below it (prefix sum). Tradeable volume is
+        # the smaller of the two.
+        buy_volume = np.cumsum(buy_at[::-1])[::-1]
+        sell_volume = np.cumsum(sell_at)
+        tradeable_volume = np.minimum(buy_volume, sell_volume)
 
-            # Calculate sell volume at this price (all sells <= price)
-            sell_volume = sum(
-                sum(o.quantity for o in orders)
-                for p, orders in sell_orders.items()
-                if p <= price
-            )
+        max_volume = int(tradeable_volume.max())
+        if max_volume <= 0:
+            return None, 0
 
-            # Tradeable volume is minimum of buy and sell
-            tradeable_volume = min(buy_volume, sell_volume)
-
-            if tradeable_volume > max_volume:
-                max_volume = tradeable_volume
-                best_price = price
-            elif tradeable_volume == max_volume and best_price is not None:
-                # Tie-breaker: choose price closer to reference
-                if self.reference_price:
-                    if abs(price - self.reference_price) < abs(
-                        best_price - self.reference_price
-                    ):
-                        best_price = price
+        # Lowest price with the maximum volume, unless a tied price is closer
+        # to the reference
+        tied = prices[tradeable_volume == max_volume].tolist()
+        best_price = tied[0]
+        if self.reference_price:
+            for price in tied[1:]:
+                if abs(price - self.reference_price) < abs(
+                    best_price - self.reference_price
+                ):
+                    best_price = price
 
         return best_price, max_volume
 
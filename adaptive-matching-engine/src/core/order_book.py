@@ -43,6 +43,11 @@ class PriceLevel:
 class AdaptivePriceLevel(PriceLevel):
     """Price level that adapts its internal ordering based on market regime"""
 
+    # Regimes whose levels are kept sorted by size (Price-Size-Time)
+    SIZE_PRIORITY_REGIMES = frozenset(
+        (MarketRegime.HIGH_VOLATILITY, MarketRegime.ILLIQUID)
+    )
+
     def __init__(self, price: float, regime: MarketRegime = MarketRegime.NORMAL):
         super().__init__(price)
         self.regime = regime
@@ -64,7 +69,7 @@ class AdaptivePriceLevel(PriceLevel):
             self._maintain_sorted = False
             self._sorted = True
             self._needs_resort = False
-        elif self.regime in [MarketRegime.HIGH_VOLATILITY, MarketRegime.ILLIQUID]:
+        elif self.regime in self.SIZE_PRIORITY_REGIMES:
             # Price-Size-Time: maintain an order list sorted by size desc then time asc
             # Instead of resorting entire collection every time, we'll create a sorted list
             # and convert back to deque for FIFO access of the prioritized order
@@ -109,6 +114,10 @@ class AdaptivePriceLevel(PriceLevel):
 class OrderBookSide:
     """Base class for Bid/Ask sides of the order book"""
 
+    # Stale heap entries tolerated beyond the live level count before the heap
+    # is rebuilt; emptied levels are otherwise dropped lazily by get_best_price
+    HEAP_SLACK = 64
+
     def __init__(self, side: OrderSide):
         self.side = side
         self.heap = []  # Min-heap for asks, Max-heap for bids (using negative prices)
@@ -143,17 +152,21 @@ class OrderBookSide:
         else:
             return -self.heap[0]  # Max price for bids
 
+    def _new_price_level(self, price: float) -> PriceLevel:
+        """Create the level object for a price seen for the first time"""
+        return PriceLevel(price)
+
     def add_order(self, order: Order) -> bool:
         """Add order to order book side"""
         price = order.price
         with self.lock:
-            if price not in self.price_levels:
+            # Single dict probe on the common path where the level exists
+            price_level = self.price_levels.get(price)
+            if price_level is None:
                 # Create new price level
-                price_level = PriceLevel(price)
+                price_level = self._new_price_level(price)
                 self.price_levels[price] = price_level
                 self._heap_push(price)
-            else:
-                price_level = self.price_levels[price]
 
             # Add order to price level
             price_level.add_order(order)
@@ -181,36 +194,24 @@ class OrderBookSide:
             del self.order_map[order_id]
             del self.order_to_price_level[order_id]
 
-            # Clean up empty price levels immediately
+            # Drop empty price levels immediately; their heap entries go stale
+            # and are skipped by get_best_price/get_depth
             if price_level.is_empty():
-                # Remove from price_levels dict
-                if price_level.price in self.price_levels:
-                    del self.price_levels[price_level.price]
-
-                # Rebuild heap without this price
-                new_heap = []
-                for price in self.price_levels.keys():
-                    if self.side == OrderSide.SELL:
-                        heapq.heappush(new_heap, price)
-                    else:
-                        heapq.heappush(new_heap, -price)
-                self.heap = new_heap
-                heapq.heapify(self.heap)
+                self._remove_price_level(price_level.price)
 
             return True
 
     def _remove_price_level(self, price: float):
-        """Remove empty price level from all data structures"""
-        if price in self.price_levels:
-            del self.price_levels[price]
+        """Remove empty price level, compacting the heap once stale entries pile up"""
+        self.price_levels.pop(price, None)
 
-        # Rebuild heap without the removed price
-        new_heap = []
-        for price_val in self.price_levels.keys():
-            self._heap_push_to_custom(new_heap, price_val)
-
-        self.heap = new_heap
-        heapq.heapify(self.heap)
+        # Rebuild in O(n) only after O(n) removals, so each costs O(1) amortized
+        if len(self.heap) > 2 * len(self.price_levels) + self.HEAP_SLACK:
+            if self.side == OrderSide.SELL:
+                self.heap = list(self.price_levels)
+            else:
+                self.heap = [-price_val for price_val in self.price_levels]
+            heapq.heapify(self.heap)
 
     def _heap_push_to_custom(self, heap: list, price: float):
         """Push price to a custom heap"""
@@ -247,6 +248,14 @@ class OrderBookSide:
 
             return None
 
+    def clear(self):
+        """Remove every order and price level in place, keeping the containers"""
+        with self.lock:
+            self.heap.clear()
+            self.price_levels.clear()
+            self.order_map.clear()
+            self.order_to_price_level.clear()
+
     def get_price_level(self, price: float) -> Optional[PriceLevel]:
         with self.lock:
             return self.price_levels.get(price)
@@ -256,16 +265,17 @@ class OrderBookSide:
         with self.lock:
             depth = []
             temp_heap = self.heap.copy()
+            last_price = None
 
-            for _ in range(min(levels, len(temp_heap))):
-                if not temp_heap:
-                    break
-
+            while temp_heap and len(depth) < levels:
                 price = self._heap_peek_from_custom(temp_heap)
-                if price is None:
-                    break
-
                 heapq.heappop(temp_heap)  # Remove from temp heap
+
+                # A price re-listed after its level emptied can appear twice
+                if price == last_price:
+                    continue
+                last_price = price
+
                 price_level = self.price_levels.get(price)
                 if price_level and not price_level.is_empty():
                     depth.append((price, price_level.total_volume))
@@ -297,13 +307,11 @@ class AdaptiveOrderBookSide(OrderBookSide):
                 if isinstance(price_level, AdaptivePriceLevel):
                     price_level.set_regime(new_regime)
 
-    def add_order(self, order: Order) -> bool:
-        price = order.price
-
-        if price not in self.price_levels:
-            # Create new adaptive price level
-            price_level = AdaptivePriceLevel(price, self.regime)
-            self.price_levels[price] = price_level
-            self._heap_push(price)
+    def clear(self):
+        """Empty the side and return it to the NORMAL regime"""
+        super().clear()
+        self.regime = MarketRegime.NORMAL
 
-        return super().add_order(order)
+    def _new_price_level(self, price: float) -> PriceLevel:
+        """New levels start in the side's current regime"""
+        return AdaptivePriceLevel(price, self.regime)
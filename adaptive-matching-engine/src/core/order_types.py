@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 from typing import Optional
 import time
@@ -48,6 +48,26 @@ class MarketRegime(Enum):
     HIGH_FREQUENCY = "HIGH_FREQUENCY"
 
 
+def _with_slots(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10+.
+    Instances get no per-object __dict__, so they are smaller and attribute
+    access is faster.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in field_names:
+        # Defaults are already baked into the generated __init__
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_with_slots
 @dataclass
 class Order:
     order_id: str
@@ -124,6 +144,7 @@ class Order:
         )
 
 
+@_with_slots
 @dataclass
 class Trade:
     trade_id: str
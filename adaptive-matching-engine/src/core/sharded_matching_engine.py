@@ -7,6 +7,7 @@ Supports both traditional NSE-style matching and adaptive matching with sharding
 
 from typing import List, Optional, Dict
 import time
+from collections import Counter
 from .sharded_order_book import ShardedOrderBookSide, ShardedAdaptiveOrderBookSide
 from .order_types import Order, OrderSide, Trade, OrderType, MarketRegime
 from .matching_engine import BaseMatchingEngine
@@ -153,6 +154,10 @@ class ShardedMatchingEngine(BaseMatchingEngine):
         else:
             self.asks.add_order(order)
 
+    def shard_of(self, order_id: str) -> int:
+        """Shard index holding order_id (the same on the bid and ask side)."""
+        return self.bids._get_shard_index(order_id)
+
     def cancel_order(self, order_id: str) -> bool:
         """Cancel order - automatically routed to correct shard."""
         # Try both sides (shard routing is automatic)
@@ -232,6 +237,9 @@ class ShardedAdaptiveMatchingEngine(BaseMatchingEngine):
         self.order_history: List[Order] = []
         self.metrics_history = []
         self.regime_history = []
+        # Per-regime transition counts, kept alongside regime_history so
+        # statistics don't rescan the history
+        self._regime_counts = Counter()
 
         self.order_count = 0
 
@@ -402,6 +410,7 @@ class ShardedAdaptiveMatchingEngine(BaseMatchingEngine):
                 "to_regime": new_regime.value,
             }
         )
+        self._regime_counts[new_regime.value] += 1
 
     def _update_market_metrics(self, order: Order):
         """Update market metrics."""
@@ -461,6 +470,10 @@ class ShardedAdaptiveMatchingEngine(BaseMatchingEngine):
             }
         )
 
+    def shard_of(self, order_id: str) -> int:
+        """Shard index holding order_id (the same on the bid and ask side)."""
+        return self.bids._get_shard_index(order_id)
+
     def cancel_order(self, order_id: str) -> bool:
         """Cancel order across shards."""
         if self.bids.remove_order(order_id):
@@ -504,15 +517,10 @@ class ShardedAdaptiveMatchingEngine(BaseMatchingEngine):
 
     def get_regime_statistics(self) -> Dict:
         """Get regime statistics."""
-        regime_counts = {}
-        for entry in self.regime_history:
-            regime = entry["to_regime"]
-            regime_counts[regime] = regime_counts.get(regime, 0) + 1
-
         return {
             "total_changes": self.regime_change_count,
             "current_regime": self.current_regime.value,
-            "regime_distribution": regime_counts,
+            "regime_distribution": dict(self._regime_counts),
             "regime_history": self.regime_history,
             "time_since_last_change": (
                 time.time() - self.last_regime_change if self.last_regime_change else 0
@@ -523,9 +531,21 @@ class ShardedAdaptiveMatchingEngine(BaseMatchingEngine):
         """Reset statistics."""
         self.metrics_history.clear()
         self.regime_history.clear()
+        self._regime_counts.clear()
         self.regime_change_count = 0
         self.order_count = 0
 
+    def reset(self):
+        """Return to a freshly constructed state, keeping the configuration."""
+        from ..adaptive.regime_detector import OptimizedRegimeDetector
+
+        super().reset()
+
+        self.regime_detector = OptimizedRegimeDetector(self.config)
+        self.current_regime = MarketRegime.NORMAL
+        self.last_regime_change = time.time()
+        self.reset_statistics()
+
     def get_statistics(self) -> Dict:
         """Get comprehensive statistics including sharding."""
         return {
@@ -18,7 +18,8 @@ Sharding strategy:
 
 from typing import List, Optional, Dict, Tuple
 from threading import RLock
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from zlib import crc32
 from .order_book import OrderBookSide, PriceLevel
 from .order_types import Order, OrderSide
 
@@ -47,10 +48,13 @@ class ShardedOrderBookSide:
             OrderBookSide(side) for _ in range(self.num_shards)
         ]
 
-        # Global best price cache with lock
+        # Global best price cache. Writers only bump _book_version; the cache
+        # is valid while _cache_version matches it, so add/remove never block
+        # on the lock that serializes best-price rescans.
         self._best_price_cache: Optional[float] = None
         self._cache_lock = RLock()
-        self._cache_valid = False
+        self._book_version = 0
+        self._cache_version = -1
 
         # Statistics
         self.total_orders = 0
@@ -59,12 +63,13 @@ class ShardedOrderBookSide:
     def _get_shard_index(self, order_id: str) -> int:
         """
         Determine which shard an order belongs to based on its ID.
-        Uses hash for uniform distribution.
+
+        CRC32 runs in C over the whole ID, so sequential IDs that share a
+        prefix still spread evenly, and unlike hash() it is stable across
+        processes (no string hash randomization).
         """
-        # Fast hash using first few characters if order_id is string
         if isinstance(order_id, str):
-            # Simple but effective: sum of character codes
-            hash_val = sum(ord(c) for c in order_id[:8])
+            hash_val = crc32(order_id.encode())
         else:
             hash_val = hash(order_id)
 
@@ -77,12 +82,52 @@ class ShardedOrderBookSide:
 
         if result:
             self.total_orders += 1
-            # Invalidate best price cache
-            with self._cache_lock:
-                self._cache_valid = False
+            # Invalidate best price cache (lock-free: bump the book version)
+            self._book_version += 1
 
         return result
 
+    def add_orders(self, orders: List[Order], max_workers: Optional[int] = None) -> int:
+        """
+        Bulk-load resting orders without matching, one task per shard.
+
+        Orders are bucketed by shard up front and each bucket is added under a
+        single acquisition of its shard's lock, with shards filled in parallel.
+        Callers must ensure the orders don't cross the opposite side.
+        """
+        buckets: List[List[Order]] = [[] for _ in range(self.num_shards)]
+        shard_index = self._get_shard_index
+        for order in orders:
+            buckets[shard_index(order.order_id)].append(order)
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.num_shards) as executor:
+            added = sum(executor.map(self._add_shard_batch, self.shards, buckets))
+
+        if added:
+            self.total_orders += added
+            self._book_version += 1
+
+        return added
+
+    @staticmethod
+    def _add_shard_batch(shard: OrderBookSide, orders: List[Order]) -> int:
+        """Add one shard's bucket of orders while holding its lock once."""
+        added = 0
+        with shard.lock:
+            add_order = shard.add_order
+            for order in orders:
+                if add_order(order):
+                    added += 1
+        return added
+
+    def clear(self):
+        """Empty every shard in place and reset the counters."""
+        for shard in self.shards:
+            shard.clear()
+        self.total_orders = 0
+        self.total_cancellations = 0
+        self._book_version += 1
+
     def remove_order(self, order_id: str) -> bool:
         """Remove order from its shard."""
         shard_idx = self._get_shard_index(order_id)
@@ -90,9 +135,8 @@ class ShardedOrderBookSide:
 
         if result:
             self.total_cancellations += 1
-            # Invalidate best price cache
-            with self._cache_lock:
-                self._cache_valid = False
+            # Invalidate best price cache (lock-free: bump the book version)
+            self._book_version += 1
 
         return result
 
@@ -105,7 +149,10 @@ class ShardedOrderBookSide:
         For SELL: returns minimum price
         """
         with self._cache_lock:
-            if self._cache_valid and self._best_price_cache is not None:
+            # Snapshot the version before scanning: a concurrent add/remove
+            # bumps it, so a result computed from a stale scan is never reused
+            version = self._book_version
+            if self._cache_version == version and self._best_price_cache is not None:
                 return self._best_price_cache
 
             # Scan all shards for best price
@@ -127,7 +174,7 @@ class ShardedOrderBookSide:
 
             # Cache the result
             self._best_price_cache = best_price
-            self._cache_valid = True
+            self._cache_version = version
 
             return best_price
 
@@ -213,8 +260,7 @@ class ShardedOrderBookSide:
         result = self.shards[shard_idx].remove_order(order.order_id)
 
         if result:
-            with self._cache_lock:
-                self._cache_valid = False
+            self._book_version += 1
 
         return result
 
@@ -264,7 +310,8 @@ class ShardedAdaptiveOrderBookSide(ShardedOrderBookSide):
         # Initialize parent class attributes
         self._best_price_cache: Optional[float] = None
         self._cache_lock = RLock()
-        self._cache_valid = False
+        self._book_version = 0
+        self._cache_version = -1
         self.total_orders = 0
         self.total_cancellations = 0
 
@@ -273,3 +320,10 @@ class ShardedAdaptiveOrderBookSide(ShardedOrderBookSide):
         self.regime = new_regime
         for shard in self.shards:
             shard.set_regime(new_regime)
+
+    def clear(self):
+        """Empty every shard and return to the NORMAL regime."""
+        from .order_types import MarketRegime
+
+        super().clear()
+        self.regime = MarketRegime.NORMAL
@@ -13,6 +13,12 @@ from ..core.order_types import Order, OrderSide, OrderType
 class NiftyDataLoader:
     """Loads and processes Nifty/Bank Nifty intraday data"""
 
+    # Order quantity tiers (small / medium / large): cumulative probability and
+    # [low, high) bounds as a fraction of the record volume (in thousandths)
+    _QUANTITY_TIER_CDF = np.array([0.7, 0.9])
+    _QUANTITY_SCALE_LOW = np.array([0.1, 0.5, 2.0])
+    _QUANTITY_SCALE_HIGH = np.array([0.5, 2.0, 10.0])
+
     def __init__(self, data_directory: str = "data"):
         self.data_directory = data_directory
         self.supported_symbols = ["NIFTY", "BANKNIFTY"]
@@ -287,104 +293,121 @@ class NiftyDataLoader:
         orders_per_record: int = 3,
         market_order_ratio: float = 0.1,
     ) -> List[Order]:
-        """Convert market data to order stream for simulation"""
-        orders = []
-
+        """Convert market data to order stream for simulation, in timestamp order"""
         if len(df) == 0:
-            return orders
+            return []
 
         # Use mid price as reference
         price_column = "mid_price" if "mid_price" in df.columns else "price"
 
         print(f"Converting {len(df)} records to orders...")
 
-        for idx, row in df.iterrows():
-            # Handle timestamp - convert to timestamp if it's a datetime object
-            if hasattr(row["timestamp"], "timestamp"):
-                base_timestamp = row["timestamp"].timestamp()
-            else:
-                base_timestamp = (
-                    float(row["timestamp"])
-                    if isinstance(row["timestamp"], (int, float))
-                    else 0.0
-                )
+        # Pull each record-level column out as an ndarray once, then draw every
+        # order's random attributes in one vectorized call per column
+        per_record = orders_per_record
+        count = len(df) * per_record
 
-            base_price = row[price_column]
-            base_volume = row.get("volume", 100)
-
-            # Generate multiple orders per market data record
-            for i in range(orders_per_record):
-                # Determine order side with some bias based on price movement
-                if idx > 0:
-                    try:
-                        prev_price = df.iloc[idx - 1][price_column]
-                        price_change = (
-                            (base_price - prev_price) / prev_price
-                            if prev_price > 0
-                            else 0
-                        )
-                        buy_probability = 0.5 - (
-                            price_change * 10
-                        )  # Adjust sensitivity
-                        buy_probability = max(0.1, min(0.9, buy_probability))
-                    except:
-                        buy_probability = 0.5
-                else:
-                    buy_probability = 0.5
+        base_price = df[price_column].to_numpy(dtype=np.float64)
+        if "volume" in df.columns:
+            base_volume = df["volume"].to_numpy(dtype=np.float64)
+        else:
+            base_volume = np.full(len(df), 100.0)
+        base_timestamp = self._timestamps_to_seconds(df["timestamp"])
+
+        # Bias the order side against the move since the previous record
+        prev_price = np.roll(base_price, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            price_change = np.where(
+                prev_price > 0, (base_price - prev_price) / prev_price, 0.0
+            )
+        buy_probability = np.clip(0.5 - price_change * 10, 0.1, 0.9)
+        buy_probability[0] = 0.5
 
-                side = (
-                    OrderSide.BUY
-                    if np.random.random() < buy_probability
-                    else OrderSide.SELL
-                )
+        is_buy = np.random.random(count) < np.repeat(buy_probability, per_record)
+        is_market = np.random.random(count) < market_order_ratio
 
-                # Determine order type
-                order_type = (
-                    OrderType.MARKET
-                    if np.random.random() < market_order_ratio
-                    else OrderType.LIMIT
-                )
-
-                # Generate price and quantity
-                if order_type == OrderType.LIMIT:
-                    # Add some spread around the mid price
-                    price_offset = np.random.normal(0, 0.001)
-                    price = base_price * (1 + price_offset)
-                else:
-                    price = 0.0  # Market order
+        # Limit orders get some spread around the mid price; market orders 0.0
+        prices = np.where(
+            is_market,
+            0.0,
+            np.repeat(base_price, per_record) * (1 + np.random.normal(0, 0.001, count)),
+        )
 
-                # Generate realistic quantity (power law distribution)
-                rand = np.random.random()
-                if rand < 0.7:  # 70% small orders
-                    quantity = max(
-                        1, int(base_volume * 0.001 * np.random.uniform(0.1, 0.5))
-                    )
-                elif rand < 0.9:  # 20% medium orders
-                    quantity = max(
-                        1, int(base_volume * 0.001 * np.random.uniform(0.5, 2.0))
-                    )
-                else:  # 10% large orders
-                    quantity = max(
-                        1, int(base_volume * 0.001 * np.random.uniform(2.0, 10.0))
-                    )
+        # Power law quantities: 70% small, 20% medium, 10% large
+        tier = np.searchsorted(
+            self._QUANTITY_TIER_CDF, np.random.random(count), side="right"
+        )
+        volume_fraction = np.random.uniform(
+            self._QUANTITY_SCALE_LOW[tier], self._QUANTITY_SCALE_HIGH[tier]
+        )
+        quantities = np.maximum(
+            1,
+            (np.repeat(base_volume, per_record) * 0.001 * volume_fraction).astype(
+                np.int64
+            ),
+        )
 
-                # Create order with realistic timestamp
-                order_timestamp = base_timestamp + (i * 0.001)
+        # Orders from the same record are spaced 1ms apart
+        offsets = np.tile(np.arange(per_record), len(df))
+        timestamps = np.repeat(base_timestamp, per_record) + offsets * 0.001
 
-                order = Order(
-                    order_id=f"{row.get('symbol', 'NIFTY')}_{idx}_{i}",
-                    side=side,
-                    price=price,
-                    quantity=quantity,
-                    timestamp=order_timestamp,
-                    order_type=order_type,
-                )
+        # Time-order the stream here, on the columns, so callers never sort
+        # Order objects; stable, so ties keep record order (a no-op pass for
+        # already-sorted records)
+        sequence = np.argsort(timestamps, kind="stable")
 
-                orders.append(order)
+        labels = np.repeat(df.index.to_numpy(), per_record)[sequence].tolist()
+        if "symbol" in df.columns:
+            symbols = np.repeat(df["symbol"].to_numpy(), per_record)[sequence].tolist()
+        else:
+            symbols = ["NIFTY"] * count
+
+        sides = (OrderSide.SELL, OrderSide.BUY)
+        order_types = (OrderType.LIMIT, OrderType.MARKET)
+
+        orders = [
+            Order(
+                order_id=f"{symbol}_{label}_{i}",
+                side=sides[buy],
+                price=price,
+                quantity=quantity,
+                timestamp=timestamp,
+                order_type=order_types[market],
+            )
+            for symbol, label, i, buy, price, quantity, timestamp, market in zip(
+                symbols,
+                labels,
+                offsets[sequence].tolist(),
+                is_buy[sequence].tolist(),
+                prices[sequence].tolist(),
+                quantities[sequence].tolist(),
+                timestamps[sequence].tolist(),
+                is_market[sequence].tolist(),
+            )
+        ]
 
         print(f"✅ Generated {len(orders)} orders from {len(df)} market records")
         return orders
 
+    @staticmethod
+    def _timestamps_to_seconds(timestamps: pd.Series) -> np.ndarray:
+        """Epoch seconds for a timestamp column (unrecognised values map to 0.0)"""
+        if pd.api.types.is_datetime64_any_dtype(timestamps):
+            return timestamps.to_numpy(dtype="datetime64[ns]").astype(np.int64) / 1e9
+        if pd.api.types.is_numeric_dtype(timestamps):
+            return timestamps.to_numpy(dtype=np.float64)
+        return np.array(
+            [
+                (
+                    ts.timestamp()
+                    if hasattr(ts, "timestamp")
+                    else float(ts) if isinstance(ts, (int, float)) else 0.0
+                )
+                for ts in timestamps
+            ],
+            dtype=np.float64,
+        )
+
     def convert_to_orders_stream(
         self,
         df: pd.DataFrame,
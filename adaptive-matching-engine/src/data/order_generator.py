@@ -1,107 +1,222 @@
-import random
-from typing import List
+from typing import Dict, List, Optional
 import time
+import numpy as np
 from ..core.order_types import Order, OrderSide, OrderType
 
 
 class OrderGenerator:
     """Generates realistic market orders for testing"""
 
-    def __init__(self, symbol: str = "NIFTY", price_range: tuple = (18000.0, 19000.0)):
+    # Integer ticks per rupee for struct-of-arrays price columns
+    PRICE_SCALE = 100
+
+    # Quantity tiers (small / medium / large): cumulative probability and
+    # [low, high) bounds for each tier
+    _QUANTITY_TIER_CDF = np.array([0.8, 0.83])
+    _QUANTITY_TIER_LOW = np.array([1, 10, 100])
+    _QUANTITY_TIER_HIGH = np.array([11, 101, 1001])
+
+    def __init__(
+        self,
+        symbol: str = "NIFTY",
+        price_range: tuple = (18000.0, 19000.0),
+        seed: Optional[int] = None,
+    ):
         """
         Initialize order generator for Indian markets.
 
         Args:
             symbol: Trading symbol (default: NIFTY for NSE)
             price_range: Price range in INR (default: typical NIFTY range)
+            seed: Optional RNG seed for reproducible order streams
         """
         self.symbol = symbol
         self.price_range = price_range
         self.last_price = (price_range[0] + price_range[1]) / 2
         self.order_id_counter = 0
+        self._rng = np.random.default_rng(seed)
+
+    def reset(self, seed: Optional[int] = None):
+        """Restart the order stream: reseed the RNGs and reset price/id state"""
+        self._rng = np.random.default_rng(seed)
+        self.last_price = (self.price_range[0] + self.price_range[1]) / 2
+        self.order_id_counter = 0
 
     def generate_orders(
         self, count: int, market_order_ratio: float = 0.1, volatility: float = 0.01
     ) -> List[Order]:
         """Generate a batch of test orders"""
-        orders = []
-
-        for _ in range(count):
-            # Determine order side (slightly biased to maintain balance)
-            side = random.choice([OrderSide.BUY, OrderSide.SELL])
-
-            # Determine order type
-            if random.random() < market_order_ratio:
-                order_type = OrderType.MARKET
-                price = 0.0
-            else:
-                order_type = OrderType.LIMIT
-                # Generate price with some volatility
-                price_variation = random.gauss(0, volatility)
-                price = self.last_price * (1 + price_variation)
-                price = max(self.price_range[0], min(self.price_range[1], price))
-                self.last_price = price
-
-            # Generate quantity (power law distribution for realism)
-            quantity = self._generate_realistic_quantity()
-
-            order = Order(
-                order_id=f"TEST_{self.order_id_counter}",
-                side=side,
-                price=price,
+        # Draw every column in one vectorized pass, then build the Order objects
+        batch = self.generate_orders_soa(count, market_order_ratio, volatility)
+        return self.orders_from_soa(batch)
+
+    @staticmethod
+    def allocate_soa(count: int) -> Dict[str, np.ndarray]:
+        """Allocate empty struct-of-arrays buffers for generate_orders_into"""
+        return {
+            "prices": np.empty(count, dtype=np.int64),
+            "quantities": np.empty(count, dtype=np.int32),
+            "sides": np.empty(count, dtype=np.int8),
+            "order_types": np.empty(count, dtype=np.int8),
+        }
+
+    def generate_orders_soa(
+        self, count: int, market_order_ratio: float = 0.1, volatility: float = 0.01
+    ) -> Dict[str, np.ndarray]:
+        """
+        Generate a batch of test orders as a struct of arrays.
+
+        Same distribution as generate_orders, but every column is drawn in a
+        single vectorized call. Prices are integer ticks (``PRICE_SCALE`` per
+        rupee), sides are 0=BUY/1=SELL and order types are 0=LIMIT/1=MARKET.
+        """
+        return self.generate_orders_into(
+            self.allocate_soa(count), market_order_ratio, volatility
+        )
+
+    def generate_orders_into(
+        self,
+        out: Dict[str, np.ndarray],
+        market_order_ratio: float = 0.1,
+        volatility: float = 0.01,
+    ) -> Dict[str, np.ndarray]:
+        """Fill caller-provided buffers (see allocate_soa) with a new batch"""
+        rng = self._rng
+        count = len(out["prices"])
+
+        sides = out["sides"]
+        order_types = out["order_types"]
+        sides[:] = rng.integers(0, 2, size=count)
+        np.less(
+            rng.random(count), market_order_ratio, out=order_types, casting="unsafe"
+        )
+
+        # Random walk over limit orders only; market orders carry price 0.
+        # Each step is clamped to the price range and the walk continues from
+        # the clamped price, so it is inherently sequential: only the normal
+        # draws are vectorized.
+        is_limit = order_types == 0
+        steps = 1.0 + rng.normal(0.0, volatility, size=int(is_limit.sum()))
+        walk = self._clamped_walk(steps.tolist())
+
+        prices = out["prices"]
+        prices[:] = 0
+        prices[is_limit] = np.rint(walk * self.PRICE_SCALE)
+
+        # Power law quantities: 80% small, 3% medium (15% of the rest), 17% large.
+        # One uniform draw picks the tier, one bounded draw fills every order.
+        tier = np.searchsorted(self._QUANTITY_TIER_CDF, rng.random(count), side="right")
+        out["quantities"][:] = rng.integers(
+            self._QUANTITY_TIER_LOW[tier], self._QUANTITY_TIER_HIGH[tier]
+        )
+
+        out["first_id"] = self.order_id_counter
+        self.order_id_counter += count
+
+        return out
+
+    def _clamped_walk(self, steps: List[float]) -> np.ndarray:
+        """Apply multiplicative steps from last_price, clamping after each one"""
+        low, high = self.price_range
+        price = self.last_price
+        walk = []
+        append = walk.append
+        for step in steps:
+            price = price * step
+            if price < low:
+                price = low
+            elif price > high:
+                price = high
+            append(price)
+        self.last_price = price
+        return np.array(walk, dtype=np.float64)
+
+    @classmethod
+    def orders_from_soa(cls, batch: Dict[str, np.ndarray]) -> List[Order]:
+        """Materialize Order objects from a generate_orders_soa batch"""
+        sides = (OrderSide.BUY, OrderSide.SELL)
+        order_types = (OrderType.LIMIT, OrderType.MARKET)
+        scale = cls.PRICE_SCALE
+        first_id = batch["first_id"]
+        # Distinct, increasing timestamps keep time priority well defined
+        # among equal-size orders in size-priority regimes
+        base_timestamp = time.time()
+
+        return [
+            Order(
+                order_id=f"TEST_{first_id + i}",
+                side=sides[side],
+                price=price / scale,
                 quantity=quantity,
-                timestamp=time.time(),
-                order_type=order_type,
+                timestamp=base_timestamp + i * 1e-6,
+                order_type=order_types[order_type],
             )
-
-            orders.append(order)
-            self.order_id_counter += 1
-
-        return orders
-
-    def _generate_realistic_quantity(self) -> int:
-        """Generate realistic order quantities (power law)"""
-        # Power law distribution: many small orders, few large ones
-        if random.random() < 0.8:  # 80% small orders
-            return random.randint(1, 10)
-        elif random.random() < 0.15:  # 15% medium orders
-            return random.randint(10, 100)
-        else:  # 5% large orders
-            return random.randint(100, 1000)
-
-    def generate_volatile_orders(self, count: int) -> List[Order]:
-        """Generate orders that create volatile market conditions"""
-        orders = []
-
-        # Create large price movements
-        for i in range(count):
-            if i % 10 == 0:  # Every 10th order creates volatility
-                # Large market order
-                order = Order(
-                    order_id=f"VOLATILE_{self.order_id_counter}",
-                    side=random.choice([OrderSide.BUY, OrderSide.SELL]),
-                    price=0.0,  # Market order
-                    quantity=random.randint(500, 2000),
-                    timestamp=time.time(),
-                    order_type=OrderType.MARKET,
-                )
-            else:
-                # Normal limit order with wider spread
-                side = random.choice([OrderSide.BUY, OrderSide.SELL])
-                price_variation = random.gauss(0, 0.05)  # High volatility
-                price = self.last_price * (1 + price_variation)
-                price = max(self.price_range[0], min(self.price_range[1], price))
-
-                order = Order(
-                    order_id=f"VOLATILE_{self.order_id_counter}",
-                    side=side,
-                    price=price,
-                    quantity=random.randint(1, 100),
-                    timestamp=time.time(),
-                    order_type=OrderType.LIMIT,
+            for i, (price, quantity, side, order_type) in enumerate(
+                zip(
+                    batch["prices"].tolist(),
+                    batch["quantities"].tolist(),
+                    batch["sides"].tolist(),
+                    batch["order_types"].tolist(),
                 )
+            )
+        ]
 
-            orders.append(order)
-            self.order_id_counter += 1
+    def generate_volatile_orders(
+        self, count: int, num_large: int = 0, large_quantity: int = 500
+    ) -> List[Order]:
+        """
+        Generate orders that create volatile market conditions.
 
-        return orders
+        The first ``num_large`` orders are market orders of ``large_quantity``;
+        in the rest, every 10th order is a large market order and the others
+        are limit orders with a wide price spread. All columns are drawn in
+        one vectorized pass. Limit prices are snapped to whole ticks
+        (``PRICE_SCALE`` per rupee), as in generate_orders.
+        """
+        rng = self._rng
+
+        # Position within the repeating volatile pattern (-1 for leading orders)
+        pattern = np.arange(count) - num_large
+        is_market = (pattern < 0) | (pattern % 10 == 0)
+
+        sides = rng.integers(0, 2, size=count)
+        quantities = np.where(
+            is_market,
+            rng.integers(500, 2001, size=count),  # Large market order
+            rng.integers(1, 101, size=count),
+        )
+        quantities[pattern < 0] = large_quantity
+
+        # Normal limit orders with wider spread (high volatility)
+        prices = np.clip(
+            self.last_price * (1.0 + rng.normal(0.0, 0.05, size=count)),
+            self.price_range[0],
+            self.price_range[1],
+        )
+        prices = np.rint(prices * self.PRICE_SCALE) / self.PRICE_SCALE
+        prices[is_market] = 0.0
+
+        side_values = (OrderSide.BUY, OrderSide.SELL)
+        type_values = (OrderType.LIMIT, OrderType.MARKET)
+        first_id = self.order_id_counter
+        self.order_id_counter += count
+        base_timestamp = time.time()
+
+        return [
+            Order(
+                order_id=f"VOLATILE_{first_id + i}",
+                side=side_values[side],
+                price=price,
+                quantity=quantity,
+                timestamp=base_timestamp + i * 1e-6,
+                order_type=type_values[market],
+            )
+            for i, (side, price, quantity, market) in enumerate(
+                zip(
+                    sides.tolist(),
+                    prices.tolist(),
+                    quantities.tolist(),
+                    is_market.tolist(),
+                )
+            )
+        ]
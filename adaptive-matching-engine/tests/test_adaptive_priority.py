@@ -0,0 +1,150 @@
+"""
+Tests for adaptive priority queues
+"""
+
+import unittest
+from src.adaptive.adaptive_priority import (
+    AdaptivePriorityManager,
+    HybridPriorityQueue,
+    PriceSizeTimePriorityQueue,
+    PriceTimePriorityQueue,
+)
+from src.core.order_types import Order, OrderSide, MarketRegime
+
+
+class TestPriceTimePriorityQueue(unittest.TestCase):
+    """Test cases for PriceTimePriorityQueue"""
+
+    def test_fifo_with_remove(self):
+        """Removing from the middle keeps the remaining orders FIFO"""
+        queue = PriceTimePriorityQueue()
+        orders = [Order(f"B{i}", OrderSide.BUY, 100.0, 10, float(i)) for i in range(4)]
+        for order in orders:
+            queue.push(order)
+
+        self.assertTrue(queue.remove(orders[1]))
+        self.assertFalse(queue.remove(orders[1]))
+
+        self.assertEqual(queue.peek(), orders[0])
+        self.assertEqual(
+            [queue.pop() for _ in range(3)], [orders[0], orders[2], orders[3]]
+        )
+        self.assertIsNone(queue.pop())
+
+
+class TestPriceSizeTimePriorityQueue(unittest.TestCase):
+    """Test cases for PriceSizeTimePriorityQueue"""
+
+    def setUp(self):
+        self.queue = PriceSizeTimePriorityQueue()
+        self.orders = [
+            Order(f"S{i}", OrderSide.SELL, 18000.0, qty, float(ts))
+            for i, (qty, ts) in enumerate([(50, 3), (300, 2), (50, 1), (300, 2)])
+        ]
+        for order in self.orders:
+            self.queue.push(order)
+
+    def test_size_then_time_ordering(self):
+        """Largest first, earlier timestamp next, arrival order on exact ties"""
+        popped = [self.queue.pop().order_id for _ in range(len(self.orders))]
+
+        self.assertEqual(popped, ["S1", "S3", "S2", "S0"])
+        self.assertIsNone(self.queue.pop())
+        self.assertTrue(self.queue.is_empty())
+
+    def test_remove(self):
+        """Removed orders are skipped and cannot be removed twice"""
+        self.assertTrue(self.queue.remove(self.orders[1]))
+        self.assertFalse(self.queue.remove(self.orders[1]))
+
+        self.assertEqual(len(self.queue), 3)
+        self.assertEqual(self.queue.peek().order_id, "S3")
+        self.assertEqual(self.queue.pop().order_id, "S3")
+
+    def test_removed_entries_stay_bounded(self):
+        """Cancel-heavy use rebuilds the heap instead of piling up dead entries"""
+        queue = self.queue
+        for i in range(10000):
+            order = Order(f"C{i}", OrderSide.SELL, 18000.0, 1 + i % 7, float(i))
+            queue.push(order)
+            queue.remove(order)
+
+        self.assertLessEqual(len(queue._heap._heap), 2 * len(queue) + 1)
+        self.assertEqual(queue.pop().order_id, "S1")
+
+    def test_orders_index_tracks_queue(self):
+        """The base orders index holds the live orders, like other queues"""
+        self.assertEqual(list(self.queue.orders), ["S0", "S1", "S2", "S3"])
+
+        self.queue.remove(self.orders[0])
+        self.queue.pop()
+
+        self.assertEqual(list(self.queue.orders), ["S2", "S3"])
+        self.assertEqual(len(self.queue), 2)
+
+
+class TestHybridPriorityQueue(unittest.TestCase):
+    """Test cases for HybridPriorityQueue"""
+
+    def test_regime_switch_reorders(self):
+        """Size regimes rank by size; NORMAL keeps the current order as FIFO"""
+        queue = HybridPriorityQueue()
+        for i, qty in enumerate([10, 500, 50]):
+            queue.push(Order(f"S{i}", OrderSide.SELL, 18000.0, qty, float(i)))
+        self.assertEqual(queue.peek().order_id, "S0")
+
+        queue.set_regime(MarketRegime.HIGH_VOLATILITY)
+        queue.push(Order("S3", OrderSide.SELL, 18000.0, 100, 3.0))
+        self.assertEqual(queue.pop().order_id, "S1")
+
+        queue.set_regime(MarketRegime.NORMAL)
+        queue.push(Order("S4", OrderSide.SELL, 18000.0, 1000, 4.0))
+        popped = [queue.pop().order_id for _ in range(len(queue))]
+
+        self.assertEqual(popped, ["S3", "S2", "S0", "S4"])
+        self.assertTrue(queue.is_empty())
+
+    def test_orders_index_in_size_regime(self):
+        """Heap-backed regimes keep the base orders index in sync"""
+        queue = HybridPriorityQueue(MarketRegime.HIGH_VOLATILITY)
+        orders = [
+            Order(f"S{i}", OrderSide.SELL, 18000.0, qty, float(i))
+            for i, qty in enumerate([10, 500, 50])
+        ]
+        for order in orders:
+            queue.push(order)
+
+        self.assertEqual(list(queue.orders), ["S0", "S1", "S2"])
+        self.assertEqual(len(queue), 3)
+
+        self.assertEqual(queue.pop().order_id, "S1")
+        self.assertTrue(queue.remove(orders[0]))
+        self.assertEqual(list(queue.orders), ["S2"])
+        self.assertEqual(len(queue), 1)
+
+
+class TestAdaptivePriorityManager(unittest.TestCase):
+    """Test cases for AdaptivePriorityManager"""
+
+    def test_prices_stay_sorted(self):
+        """Active prices are kept sorted as levels are created and emptied"""
+        manager = AdaptivePriorityManager()
+        orders = [
+            Order(f"B{i}", OrderSide.BUY, price, 10, float(i))
+            for i, price in enumerate([101.0, 99.0, 100.0, 99.0])
+        ]
+        for order in orders:
+            manager.add_order(order)
+
+        self.assertEqual(manager.get_all_prices(), [99.0, 100.0, 101.0])
+        self.assertEqual(manager.get_best_price(OrderSide.BUY), 101.0)
+        self.assertEqual(manager.get_best_price(OrderSide.SELL), 99.0)
+
+        manager.remove_order(orders[0])
+        manager.remove_order(orders[1])
+        self.assertEqual(manager.get_all_prices(), [99.0, 100.0])
+        self.assertEqual(manager.get_best_price(OrderSide.BUY), 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
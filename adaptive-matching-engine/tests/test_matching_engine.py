@@ -7,7 +7,7 @@ import time
 from typing import List
 
 from src.core.matching_engine import AdaptiveMatchingEngine, BaseMatchingEngine
-from src.core.order_types import Order, OrderSide, OrderType, Trade
+from src.core.order_types import Order, OrderSide, OrderType, Trade, MarketRegime
 from src.data.order_generator import OrderGenerator
 
 
@@ -106,6 +106,36 @@ class TestBaseMatchingEngine(unittest.TestCase):
         self.assertEqual(snapshot.bids[0][0], 100.0)  # Best bid price
         self.assertEqual(snapshot.asks[0][0], 101.0)  # Best ask price
 
+    def test_process_orders_batch(self):
+        """Batch processing should match processing orders one at a time"""
+        orders_a = OrderGenerator(seed=5).generate_orders(500)
+        orders_b = OrderGenerator(seed=5).generate_orders(500)
+
+        batch_trades = self.engine.process_orders(orders_a)
+
+        sequential = BaseMatchingEngine()
+        sequential_trades = []
+        for order in orders_b:
+            sequential_trades.extend(sequential.process_order(order))
+
+        self.assertEqual(
+            [(t.price, t.quantity) for t in batch_trades],
+            [(t.price, t.quantity) for t in sequential_trades],
+        )
+        self.assertEqual(len(self.engine.order_history), 500)
+
+    def test_cancel_orders_batch(self):
+        """Batch cancellation should count only orders that were resting"""
+        resting = [Order.create_limit_order(OrderSide.BUY, 99.0, 10) for _ in range(3)]
+        self.engine.process_orders(resting)
+
+        cancelled = self.engine.cancel_orders(
+            [resting[0].order_id, "MISSING", resting[2].order_id, resting[0].order_id]
+        )
+
+        self.assertEqual(cancelled, 2)
+        self.assertEqual(list(self.engine.bids.order_map), [resting[1].order_id])
+
 
 class TestAdaptiveMatchingEngine(unittest.TestCase):
     """Test cases for AdaptiveMatchingEngine"""
@@ -154,6 +184,20 @@ class TestAdaptiveMatchingEngine(unittest.TestCase):
         self.assertEqual(self.engine.regime_change_count, 1)
         self.assertGreater(len(self.engine.regime_history), 0)
 
+    def test_regime_distribution(self):
+        """Regime statistics should count transitions into each regime"""
+        self.engine._transition_regime(MarketRegime.HIGH_VOLATILITY)
+        self.engine._transition_regime(MarketRegime.ILLIQUID)
+        self.engine._transition_regime(MarketRegime.HIGH_VOLATILITY)
+
+        stats = self.engine.get_regime_statistics()
+        self.assertEqual(
+            stats["regime_distribution"], {"HIGH_VOLATILITY": 2, "ILLIQUID": 1}
+        )
+
+        self.engine.reset_statistics()
+        self.assertEqual(self.engine.get_regime_statistics()["regime_distribution"], {})
+
     def test_volatile_market_handling(self):
         """Test engine behavior in volatile market conditions"""
         # Generate volatile orders
@@ -227,6 +271,22 @@ class TestAdaptiveMatchingEngine(unittest.TestCase):
         # detection_interval=5 -> record_interval = max(1,5//10)=1 -> record every order
         self.assertGreaterEqual(len(engine.metrics_history), 3)
 
+    def test_reset_restores_fresh_state(self):
+        """reset() should clear books, history and regime state but keep config"""
+        engine = AdaptiveMatchingEngine(config={"detection_interval": 5})
+        engine.process_orders(self.generator.generate_orders(200, volatility=0.05))
+
+        engine.reset()
+
+        self.assertEqual(engine.get_order_book_snapshot().bids, [])
+        self.assertEqual(engine.get_order_book_snapshot().asks, [])
+        self.assertEqual(engine.trade_history, [])
+        self.assertEqual(engine.order_history, [])
+        self.assertEqual(engine.metrics_history, [])
+        self.assertEqual(engine.regime_change_count, 0)
+        self.assertEqual(engine.current_regime, MarketRegime.NORMAL)
+        self.assertEqual(engine.get_config()["detection_interval"], 5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -242,6 +242,20 @@ class TestNSEMatchingEngine(unittest.TestCase):
         self.assertIn("trading_phase", stats)
         self.assertIn("last_traded_price", stats)
 
+    def test_process_orders_batch(self):
+        """Batch processing returns the trades of every order in the batch"""
+        base = time.time()
+        orders = [
+            Order("B1", OrderSide.BUY, 100.0, 50, base),
+            Order("S1", OrderSide.SELL, 100.0, 30, base + 1e-6),
+            Order("S2", OrderSide.SELL, 100.0, 30, base + 2e-6),
+        ]
+
+        trades = self.engine.process_orders(orders)
+
+        self.assertEqual([t.quantity for t in trades], [30, 20])
+        self.assertEqual(self.engine.get_statistics()["total_orders"], 3)
+
 
 class TestCallAuctionEquilibrium(unittest.TestCase):
     """Specific tests for call auction equilibrium price calculation."""
@@ -11,6 +11,7 @@ from src.core.order_book import (
     PriceLevel,
     AdaptivePriceLevel,
 )
+from src.core.sharded_order_book import ShardedOrderBookSide
 from src.core.order_types import Order, OrderSide, OrderType, MarketRegime
 
 
@@ -151,6 +152,45 @@ class TestOrderBookSide(unittest.TestCase):
         prices = [level[0] for level in depth]
         self.assertEqual(prices, sorted(prices, reverse=True))
 
+    def test_clear_in_place(self):
+        """clear() should empty the side while keeping it usable"""
+        order_map = self.bid_side.order_map
+        for price in (99.0, 100.0, 101.0):
+            self.bid_side.add_order(Order.create_limit_order(OrderSide.BUY, price, 10))
+
+        self.bid_side.clear()
+
+        self.assertIs(self.bid_side.order_map, order_map)
+        self.assertEqual(self.bid_side.heap, [])
+        self.assertIsNone(self.bid_side.get_best_price())
+
+        self.bid_side.add_order(Order.create_limit_order(OrderSide.BUY, 98.0, 5))
+        self.assertEqual(self.bid_side.get_depth(5), [(98.0, 5)])
+
+    def test_emptied_levels_leave_heap_consistent(self):
+        """Removing and re-listing levels should keep best price and depth exact"""
+        orders = [
+            Order(f"B{i}", OrderSide.BUY, 200.0 - i % 200, 10, float(i))
+            for i in range(1000)
+        ]
+        for order in orders:
+            self.bid_side.add_order(order)
+
+        # Empty every level above 50.0, then re-list the best one
+        for order in orders:
+            if order.price > 50.0:
+                self.bid_side.remove_order(order.order_id)
+        self.bid_side.add_order(Order("X", OrderSide.BUY, 60.0, 7, 0.0))
+
+        self.assertEqual(self.bid_side.get_best_price(), 60.0)
+        self.assertEqual(
+            self.bid_side.get_depth(3), [(60.0, 7), (50.0, 50), (49.0, 50)]
+        )
+        self.assertLessEqual(
+            len(self.bid_side.heap),
+            2 * len(self.bid_side.price_levels) + OrderBookSide.HEAP_SLACK,
+        )
+
 
 class TestAdaptiveOrderBookSide(unittest.TestCase):
     """Test cases for AdaptiveOrderBookSide"""
@@ -239,5 +279,40 @@ class TestAdaptivePriceLevel(unittest.TestCase):
         self.assertEqual(order_quantities, [200, 100, 50])
 
 
+class TestShardedOrderBookSide(unittest.TestCase):
+    """Test cases for ShardedOrderBookSide"""
+
+    def test_bulk_add_matches_serial(self):
+        """add_orders should place every order in the same shard as add_order"""
+        orders = [
+            Order(f"B{i}", OrderSide.BUY, 100.0 - i % 7, 10, float(i))
+            for i in range(200)
+        ]
+        serial = ShardedOrderBookSide(OrderSide.BUY, num_shards=4)
+        for order in orders:
+            serial.add_order(order)
+
+        bulk = ShardedOrderBookSide(OrderSide.BUY, num_shards=4)
+        bulk.get_best_price()  # Populate the cache before loading
+
+        self.assertEqual(bulk.add_orders(orders), 200)
+        self.assertEqual(bulk.total_orders, 200)
+        self.assertEqual(bulk.get_best_price(), 100.0)
+        self.assertEqual(bulk.get_depth(10), serial.get_depth(10))
+        self.assertEqual(
+            [set(shard.order_map) for shard in bulk.shards],
+            [set(shard.order_map) for shard in serial.shards],
+        )
+
+    def test_sequential_ids_spread_evenly(self):
+        """IDs sharing a long prefix should still land evenly across shards"""
+        side = ShardedOrderBookSide(OrderSide.BUY, num_shards=8)
+        counts = [0] * 8
+        for i in range(8000):
+            counts[side._get_shard_index(f"TEST_{1000000 + i}")] += 1
+
+        self.assertLess(max(counts) - min(counts), 200)
+
+
 if __name__ == "__main__":
     unittest.main()
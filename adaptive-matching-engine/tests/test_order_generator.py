@@ -0,0 +1,118 @@
+"""
+Tests for the synthetic order generator
+"""
+
+import unittest
+import numpy as np
+from src.data.order_generator import OrderGenerator
+from src.core.order_types import OrderSide, OrderType
+
+
+class TestOrderGenerator(unittest.TestCase):
+    """Test cases for OrderGenerator"""
+
+    def test_seed_reproducible(self):
+        """Same seed should produce the same order stream"""
+        orders_a = OrderGenerator(seed=7).generate_orders(200)
+        orders_b = OrderGenerator(seed=7).generate_orders(200)
+
+        self.assertEqual(
+            [(o.side, o.price, o.quantity, o.order_type) for o in orders_a],
+            [(o.side, o.price, o.quantity, o.order_type) for o in orders_b],
+        )
+
+    def test_soa_batch_columns(self):
+        """SoA batches should have typed columns within the configured bounds"""
+        generator = OrderGenerator(price_range=(18000.0, 19000.0), seed=1)
+        batch = generator.generate_orders_soa(1000)
+
+        self.assertEqual(batch["prices"].dtype, np.int64)
+        self.assertEqual(batch["quantities"].dtype, np.int32)
+        self.assertEqual(len(batch["sides"]), 1000)
+
+        limit = batch["order_types"] == 0
+        self.assertTrue(np.all(batch["prices"][~limit] == 0))
+        self.assertTrue(
+            np.all(batch["prices"][limit] >= 18000 * OrderGenerator.PRICE_SCALE)
+        )
+        self.assertTrue(
+            np.all(batch["prices"][limit] <= 19000 * OrderGenerator.PRICE_SCALE)
+        )
+        self.assertTrue(np.all(batch["quantities"] >= 1))
+        self.assertEqual(generator.order_id_counter, 1000)
+
+    def test_price_walk_clamped_per_step(self):
+        """The walk continues from clamped prices instead of piling up at the bounds"""
+        orders = OrderGenerator(seed=42).generate_orders(10000)
+        prices = np.array([o.price for o in orders if o.order_type == OrderType.LIMIT])
+
+        at_bounds = np.mean((prices == 18000.0) | (prices == 19000.0))
+        self.assertLess(at_bounds, 0.4)
+        self.assertGreater(len(np.unique(prices)), 3000)
+
+    def test_orders_from_soa(self):
+        """Materialized orders should mirror the SoA columns"""
+        batch = OrderGenerator(seed=2).generate_orders_soa(50)
+        orders = OrderGenerator.orders_from_soa(batch)
+
+        self.assertEqual(len(orders), 50)
+        for i, order in enumerate(orders):
+            self.assertEqual(order.order_id, f"TEST_{i}")
+            self.assertEqual(order.quantity, batch["quantities"][i])
+            if batch["order_types"][i] == 1:
+                self.assertEqual(order.order_type, OrderType.MARKET)
+            else:
+                self.assertAlmostEqual(
+                    order.price, batch["prices"][i] / OrderGenerator.PRICE_SCALE
+                )
+            expected_side = OrderSide.BUY if batch["sides"][i] == 0 else OrderSide.SELL
+            self.assertEqual(order.side, expected_side)
+
+    def test_timestamps_strictly_increase(self):
+        """Each order gets its own timestamp, in generation order"""
+        generator = OrderGenerator(seed=5)
+        for orders in (
+            generator.generate_orders(1000),
+            generator.generate_volatile_orders(1000),
+        ):
+            timestamps = np.array([o.timestamp for o in orders])
+            self.assertTrue(np.all(np.diff(timestamps) > 0))
+
+    def test_reset_and_generate_into(self):
+        """reset() should replay the stream into reused buffers"""
+        generator = OrderGenerator(seed=3)
+        first = generator.generate_orders_soa(300)
+
+        buffers = OrderGenerator.allocate_soa(300)
+        generator.reset(3)
+        replay = generator.generate_orders_into(buffers)
+
+        self.assertIs(replay, buffers)
+        self.assertEqual(replay["first_id"], 0)
+        for column in ("prices", "quantities", "sides", "order_types"):
+            np.testing.assert_array_equal(first[column], replay[column])
+
+    def test_volatile_orders_pattern(self):
+        """Leading large orders, then every 10th order is a market order"""
+        orders = OrderGenerator(seed=4).generate_volatile_orders(
+            35, num_large=5, large_quantity=700
+        )
+
+        self.assertEqual(len(orders), 35)
+        for order in orders[:5]:
+            self.assertEqual(order.order_type, OrderType.MARKET)
+            self.assertEqual(order.quantity, 700)
+        for i, order in enumerate(orders[5:]):
+            if i % 10 == 0:
+                self.assertEqual(order.order_type, OrderType.MARKET)
+                self.assertTrue(500 <= order.quantity <= 2000)
+            else:
+                self.assertEqual(order.order_type, OrderType.LIMIT)
+                self.assertTrue(1 <= order.quantity <= 100)
+                self.assertTrue(18000.0 <= order.price <= 19000.0)
+                ticks = order.price * OrderGenerator.PRICE_SCALE
+                self.assertEqual(order.price, round(ticks) / OrderGenerator.PRICE_SCALE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests for regime matching policies
+"""
+
+import unittest
+from src.adaptive.policies import PolicyManager
+from src.core.order_types import Order, OrderSide, MarketRegime
+
+
+class TestPolicyManager(unittest.TestCase):
+    """Test cases for PolicyManager matching algorithms"""
+
+    def setUp(self):
+        self.manager = PolicyManager()
+        self.resting = [
+            Order(f"S{i}", OrderSide.SELL, 18000.0, qty, float(i))
+            for i, qty in enumerate([50, 300, 50, 300, 7])
+        ]
+
+    def test_size_priority_ordering(self):
+        """Largest orders first, earlier timestamp breaks ties"""
+        self.manager.set_current_policy(MarketRegime.HIGH_VOLATILITY)
+        incoming = Order("B1", OrderSide.BUY, 18000.0, 10, 10.0)
+
+        ranked = self.manager.apply_matching_policy(self.resting, incoming)
+
+        self.assertEqual([o.order_id for o in ranked], ["S1", "S3", "S0", "S2", "S4"])
+
+    def test_pro_rata_small_order_is_fifo(self):
+        """Incoming orders below the pro-rata threshold keep FIFO order"""
+        self.manager.set_current_policy(MarketRegime.HIGH_FREQUENCY)
+        incoming = Order("B1", OrderSide.BUY, 18000.0, 10, 10.0)
+
+        ranked = self.manager.apply_matching_policy(self.resting, incoming)
+
+        self.assertEqual(ranked, self.resting)
+
+    def test_large_levels_rank_like_small_ones(self):
+        """The lexsort path for deep levels matches the sorted() ranking"""
+        self.manager.set_current_policy(MarketRegime.HIGH_FREQUENCY)
+        incoming = Order("B1", OrderSide.BUY, 18000.0, 500, 1000.0)
+        resting = [
+            Order(f"S{i}", OrderSide.SELL, 18000.0, 1 + i * 7 % 13, float(i % 17))
+            for i in range(150)
+        ]
+        expected = sorted(resting, key=lambda o: (-o.remaining_quantity, o.timestamp))
+
+        self.assertEqual(
+            self.manager.apply_matching_policy(resting, incoming), expected
+        )
+        self.assertEqual(
+            self.manager.apply_matching_policy(resting[:20], incoming),
+            [o for o in expected if o in resting[:20]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -51,6 +51,34 @@ class TestRegimeDetector(unittest.TestCase):
         self.assertGreater(volatility, 0)
         self.assertLess(volatility, 1.0)  # Should be reasonable
 
+    def test_windowed_volatility_matches_numpy(self):
+        """Rolling volatility stays exact at NIFTY-sized prices"""
+        detector = RegimeDetector({"detection_interval": 1, "window_size": 50})
+        prices = 20000.0 * (1 + np.random.default_rng(0).normal(0, 0.0005, 500))
+
+        for price in prices.tolist():
+            detector.update_metrics(price, 100, OrderSide.BUY, 0.01)
+
+        window = prices[-50:]
+        self.assertAlmostEqual(
+            detector.calculate_volatility() / (window.std() / window.mean()),
+            1.0,
+            places=9,
+        )
+
+    def test_cached_metrics_follow_book_inputs(self):
+        """Metrics are updated in place; book fields track the latest inputs"""
+        for price in [100.0, 101.0, 99.0]:
+            self.detector.update_metrics(price, 100, OrderSide.BUY, 0.01)
+
+        first = self.detector._calculate_fast_metrics(99.0, 101.0, 300, 100)
+        second = self.detector._calculate_fast_metrics(98.0, 100.0, 100, 100)
+
+        self.assertIs(first, second)
+        self.assertEqual(second.mid_price, 99.0)
+        self.assertEqual(second.order_book_imbalance, 0.0)
+        self.assertGreater(second.volatility, 0)
+
     def test_volume_imbalance_calculation(self):
         """Test volume imbalance calculation"""
         # Add balanced volume